@@ -3,7 +3,7 @@
 
 # Set the base directory to where this script is located
 $BASE_DIR = Split-Path -Parent $MyInvocation.MyCommand.Path
-$PYTHON_PATH = $BASE_DIR
+$PYTHON_PATH = Join-Path $BASE_DIR "src"
 
 # Ensure we have the virtual environment
 if (Test-Path -Path ".venv") {
@@ -5,7 +5,7 @@
 
 # Set the base directory to where this script is located
 BASE_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
-PYTHON_PATH="$BASE_DIR"
+PYTHON_PATH="$BASE_DIR/src"
 
 # Ensure we have the virtual environment
 if [ -d ".venv" ]; then
@@ -2,5 +2,11 @@
 ResumeAI - AI-powered resume maker and optimizer
 """
 
+import logging
+
+# Handlers are the application's to configure (see utils.log_config); this
+# only keeps the package from falling back to logging's last-resort handler
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __version__ = "0.1.0"
 __author__ = "ResumeAI Team"
@@ -1,75 +1,120 @@
 import os
 import sys
 import argparse
+import functools
 import logging
-import json
 from pathlib import Path
 from typing import Dict, Any
+from resumemaker.utils.log_config import configure_logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Logging is configured in main() once we know a command will actually run
 logger = logging.getLogger(__name__)
 
-# Add the src directory to the path so we can import our modules
-src_dir = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(src_dir))
+# Tool, crew and pipeline imports are deferred into the command handlers below
+# so that `--help` and argument errors don't pay for crewai/langchain start-up.
 
-from resumemaker.tools.custom_tool import PDFAnalyzerTool
-from resumemaker.tools.resume_analyzer_tool import ResumeAnalyzerTool
-from resumemaker.tools.template_manager_tool import TemplateManagerTool
-from resumemaker.tools.job_keyword_extractor_tool import JobKeywordExtractorTool
-from resumemaker.crews.poem_crew.data_extraction_crew import DataExtraction
-from resumemaker.utils.api_check import check_api_keys
-from resumemaker.main import complete_resume_pipeline
+@functools.lru_cache(maxsize=None)
+def _required_inputs_parent():
+    """--resume/--job, required, shared by generate, analyze and extract"""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--resume", "-r", required=True, help="Path to resume PDF file")
+    parent.add_argument("--job", "-j", required=True, help="Path to job description file")
+    return parent
 
-def parse_args():
-    """Parse command line arguments"""
-    parser = argparse.ArgumentParser(description="Resume Maker CLI")
-    
-    # Create subparsers for different commands
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-    
-    # Generate command
-    generate_parser = subparsers.add_parser("generate", help="Generate a resume")
-    generate_parser.add_argument("--resume", "-r", required=True, help="Path to resume PDF file")
-    generate_parser.add_argument("--job", "-j", required=True, help="Path to job description file")
+@functools.lru_cache(maxsize=None)
+def _profile_links_parent():
+    """--linkedin/--github, shared by generate and extract"""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--linkedin", "-l", help="LinkedIn profile URL")
+    parent.add_argument("--github", "-g", help="GitHub username")
+    return parent
+
+def _build_generate_parser(subparsers):
+    generate_parser = subparsers.add_parser(
+        "generate", help="Generate a resume",
+        parents=[_required_inputs_parent(), _profile_links_parent()]
+    )
     generate_parser.add_argument("--template", "-t", default="classic", help="Template name to use (default: classic)")
     generate_parser.add_argument("--output", "-o", help="Output directory (default: ./output)")
-    generate_parser.add_argument("--linkedin", "-l", help="LinkedIn profile URL")
-    generate_parser.add_argument("--github", "-g", help="GitHub username")
-    
-    # Analyze command
-    analyze_parser = subparsers.add_parser("analyze", help="Analyze a resume against a job description")
-    analyze_parser.add_argument("--resume", "-r", required=True, help="Path to resume PDF file")
-    analyze_parser.add_argument("--job", "-j", required=True, help="Path to job description file")
-    
-    # Keywords command
+
+def _build_analyze_parser(subparsers):
+    subparsers.add_parser(
+        "analyze", help="Analyze a resume against a job description",
+        parents=[_required_inputs_parent()]
+    )
+
+def _build_keywords_parser(subparsers):
     keywords_parser = subparsers.add_parser("keywords", help="Extract keywords from a job description")
     keywords_parser.add_argument("--job", "-j", required=True, help="Path to job description file")
     keywords_parser.add_argument("--resume", "-r", help="Optional: Path to resume PDF file for comparison")
     keywords_parser.add_argument("--max", "-m", type=int, default=30, help="Maximum number of keywords to extract")
     keywords_parser.add_argument("--output", "-o", help="Output JSON file for results")
-    
-    # Template command
+
+def _build_template_parser(subparsers):
     template_parser = subparsers.add_parser("template", help="Manage resume templates")
     template_parser.add_argument("action", choices=["list", "get", "create", "save", "delete"], help="Template action")
     template_parser.add_argument("--name", "-n", help="Template name")
     template_parser.add_argument("--type", "-t", default="latex", choices=["latex", "html"], help="Template type")
     template_parser.add_argument("--file", "-f", help="JSON file containing template content for create/save actions")
-    
-    # Extract command
-    extract_parser = subparsers.add_parser("extract", help="Extract data from resume and job description")
-    extract_parser.add_argument("--resume", "-r", required=True, help="Path to resume PDF file")
-    extract_parser.add_argument("--job", "-j", required=True, help="Path to job description file")
-    extract_parser.add_argument("--linkedin", "-l", help="LinkedIn profile URL")
-    extract_parser.add_argument("--github", "-g", help="GitHub username")
+
+def _build_extract_parser(subparsers):
+    extract_parser = subparsers.add_parser(
+        "extract", help="Extract data from resume and job description",
+        parents=[_required_inputs_parent(), _profile_links_parent()]
+    )
     extract_parser.add_argument("--output", "-o", help="Output JSON file (default: ./output/candidate_profile.json)")
-    
-    # Full pipeline command (new)
+
+def _build_pipeline_parser(subparsers):
     pipeline_parser = subparsers.add_parser("full-pipeline", help="Run the complete resume creation pipeline")
     pipeline_parser.add_argument("--config", "-c", help="Custom config file path (optional)")
+    pipeline_parser.add_argument("--fresh", action="store_true", help="Re-run data extraction even if the inputs are unchanged")
+
+def _build_batch_parser(subparsers):
+    batch_parser = subparsers.add_parser("batch-pipeline", help="Run the complete pipeline for several candidates")
+    batch_parser.add_argument("configs", nargs="+", help="Config files, one per candidate, in the same format as config.json")
+    batch_parser.add_argument("--parallel", "-p", type=int, default=4, help="Maximum candidates processed at once (default: 4)")
+    batch_parser.add_argument("--fresh", action="store_true", help="Re-run data extraction even if the inputs are unchanged")
+
+SUBPARSER_BUILDERS = {
+    "generate": _build_generate_parser,
+    "analyze": _build_analyze_parser,
+    "keywords": _build_keywords_parser,
+    "template": _build_template_parser,
+    "extract": _build_extract_parser,
+    "full-pipeline": _build_pipeline_parser,
+    "batch-pipeline": _build_batch_parser,
+}
+
+def _sniff_subcommand(argv):
+    """Return the first known subcommand in argv, or None"""
+    for token in argv:
+        if token in SUBPARSER_BUILDERS:
+            return token
+    return None
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Resume Maker CLI")
     
-    return parser.parse_args()
+    # Create subparsers for different commands
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    
+    # Only build the subparser that will actually be used; the full set is
+    # needed for top-level help and for argparse's invalid-choice message.
+    # The parser is not cached on disk: ArgumentParser keeps a locally defined
+    # `identity` type function and cannot be pickled, and building one
+    # subparser takes well under a millisecond.
+    command = _sniff_subcommand(argv)
+    if command is not None:
+        SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in SUBPARSER_BUILDERS.values():
+            build(subparsers)
+    
+    return parser.parse_args(argv)
 
 def read_file(file_path: str) -> str:
     """Read text from a file"""
@@ -79,16 +124,21 @@ def read_file(file_path: str) -> str:
     
     try:
         if path.suffix.lower() == '.pdf':
-            pdf_analyzer = PDFAnalyzerTool()
-            return pdf_analyzer._run(str(path))
+            from resumemaker.utils.pdf_cache import get_or_extract
+            return get_or_extract(path)
         else:
-            return path.read_text(encoding="utf-8")
+            # One unbuffered read of the whole file, decoded once
+            with open(path, 'rb', buffering=0) as f:
+                data = f.read()
+            return data.decode("utf-8")
     except Exception as e:
         logger.error(f"Error reading file {file_path}: {str(e)}")
         raise
 
 def analyze_resume(args):
     """Analyze a resume against a job description"""
+    from resumemaker.tools.resume_analyzer_tool import ResumeAnalyzerTool
+
     try:
         resume_analyzer = ResumeAnalyzerTool()
         job_text = read_file(args.job)
@@ -134,6 +184,9 @@ def analyze_resume(args):
 
 def extract_keywords(args):
     """Extract keywords from a job description and compare with resume if available"""
+    from resumemaker.utils import json_io
+    from resumemaker.tools.job_keyword_extractor_tool import JobKeywordExtractorTool
+
     try:
         # Read job description
         job_text = read_file(args.job)
@@ -161,8 +214,8 @@ def extract_keywords(args):
         if args.output:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(result, f, indent=2)
+            with open(output_path, 'wb') as f:
+                f.write(json_io.dumps(result))
             print(f"Keywords saved to {output_path}")
         
         # Print results in a user-friendly format
@@ -211,6 +264,9 @@ def extract_keywords(args):
 
 def manage_templates(args):
     """Manage resume templates"""
+    from resumemaker.utils import json_io
+    from resumemaker.tools.template_manager_tool import TemplateManagerTool
+
     try:
         template_manager = TemplateManagerTool()
         
@@ -236,7 +292,7 @@ def manage_templates(args):
                 
             if args.action == "get":
                 print(f"\n=== Template: {args.name} ({args.type}) ===")
-                print(json.dumps(result.get("template", {}), indent=2))
+                print(json_io.dumps(result.get("template", {})).decode("utf-8"))
             else:
                 print(result.get("message", f"Template {args.name} deleted successfully"))
                 
@@ -250,8 +306,8 @@ def manage_templates(args):
                 return 1
                 
             try:
-                with open(args.file, 'r') as f:
-                    template_content = json.load(f)
+                with open(args.file, 'rb') as f:
+                    template_content = json_io.loads(f.read())
             except Exception as e:
                 logger.error(f"Error reading template file: {str(e)}")
                 return 1
@@ -277,6 +333,12 @@ def manage_templates(args):
 
 def extract_data(args):
     """Extract data from resume and job description"""
+    from resumemaker.utils import json_io
+    from resumemaker.utils.io_batch import BatchWriter
+    from resumemaker.utils.pdf_cache import get_or_extract
+    from resumemaker.crews.poem_crew.data_extraction_crew import DataExtraction
+    from resumemaker.utils.api_check import check_api_keys
+
     try:
         # Check API keys first
         if not check_api_keys():
@@ -292,8 +354,7 @@ def extract_data(args):
         output_file = Path(output_file)
         
         # Read resume and job description
-        pdf_analyzer = PDFAnalyzerTool()
-        resume_text = pdf_analyzer._run(args.resume)
+        resume_text = get_or_extract(args.resume)
         job_text = read_file(args.job)
         
         # Set LinkedIn and GitHub info
@@ -319,8 +380,8 @@ def extract_data(args):
         )
         
         # Save result to output file
-        with open(output_file, "w") as f:
-            json.dump(result.dict(), f, indent=2)
+        with BatchWriter() as writer:
+            output_file = json_io.dump_profile(result.model_dump(), output_file, writer=writer)
             
         logger.info(f"Data extraction complete. Results saved to {output_file}")
         print(f"Data extraction complete. Results saved to {output_file}")
@@ -338,40 +399,40 @@ def generate_resume(args):
 
 def run_full_pipeline(args):
     """Run the complete end-to-end pipeline for resume creation"""
+    import shutil
+    from resumemaker.main import complete_resume_pipeline
+    from resumemaker.utils.paths import INPUT_DIR
+
+    default_config = None  # set once the custom config has been swapped in
+    backup_path = None  # set once the original config has been copied aside
     try:
         # If a custom config file is provided, temporarily replace the default one
-        config_backup = None
         if args.config:
             config_path = Path(args.config)
             if not config_path.exists():
                 logger.error(f"Config file not found: {args.config}")
                 return 1
                 
-            input_dir = Path(__file__).resolve().parents[3] / "input"
-            default_config = input_dir / "config.json"
+            target_config = INPUT_DIR / "config.json"
             
-            if default_config.exists():
+            if target_config.exists():
                 # Backup the existing config
-                with open(default_config, 'r') as f:
-                    config_backup = f.read()
+                staged_backup = target_config.with_suffix(".json.bak")
+                shutil.copy2(target_config, staged_backup)
+                backup_path = staged_backup
                     
-            # Replace with custom config
-            with open(config_path, 'r') as src, open(default_config, 'w') as dst:
-                dst.write(src.read())
+            # Swap in the custom config atomically so a crash never leaves a partial file
+            staged_path = target_config.with_suffix(".json.tmp")
+            shutil.copy2(config_path, staged_path)
+            os.replace(staged_path, target_config)
+            default_config = target_config
             
             logger.info(f"Using custom config from {args.config}")
         
         logger.info("Starting complete resume creation pipeline...")
         
         # Run the integrated pipeline
-        success = complete_resume_pipeline()
-        
-        # Restore the original config if needed
-        if config_backup is not None:
-            input_dir = Path(__file__).resolve().parents[3] / "input"
-            default_config = input_dir / "config.json"
-            with open(default_config, 'w') as f:
-                f.write(config_backup)
+        success = complete_resume_pipeline(reuse_extraction=not args.fresh)
         
         if success:
             logger.info("✅ Resume creation pipeline completed successfully!")
@@ -384,9 +445,63 @@ def run_full_pipeline(args):
         logger.error(f"Error running resume creation pipeline: {str(e)}")
         return 1
 
+    finally:
+        # Restore the original config even if the pipeline crashed. A failed
+        # restore is logged rather than raised so it can't mask the original error
+        try:
+            if default_config is None:
+                # The swap never happened; the original config is untouched
+                if backup_path is not None:
+                    backup_path.unlink(missing_ok=True)
+            elif backup_path is not None:
+                os.replace(backup_path, default_config)
+            else:
+                default_config.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"Could not restore the original config: {str(e)}")
+
+def run_batch_pipeline(args):
+    """Run the complete pipeline for every candidate config given"""
+    from resumemaker.utils import json_io
+    from resumemaker.main import complete_resume_pipeline_batch
+
+    configs = []
+    for config_file in args.configs:
+        config_path = Path(config_file)
+        if not config_path.exists():
+            logger.error(f"Config file not found: {config_file}")
+            return 1
+        configs.append(json_io.loads(config_path.read_bytes()))
+
+    logger.info(f"Starting resume creation for {len(configs)} candidates ({args.parallel} at a time)...")
+    failures = complete_resume_pipeline_batch(configs, n_parallel=args.parallel, reuse_extraction=not args.fresh)
+
+    if failures:
+        logger.error(f"❌ {failures} of {len(configs)} pipelines failed.")
+        return 1
+    logger.info("✅ All resume creation pipelines completed successfully!")
+    return 0
+
+def print_version():
+    """Print the installed package version"""
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        print(version("resumemaker"))
+    except PackageNotFoundError:
+        # Running from a source checkout without an install
+        from resumemaker import __version__
+        print(__version__)
+    return 0
+
 def main():
     """Main entry point for the CLI"""
+    # Answer version queries before argparse is even constructed
+    if len(sys.argv) >= 2 and sys.argv[1] in ("-V", "--version"):
+        return print_version()
+
     args = parse_args()
+    configure_logging()
     
     if args.command == "analyze":
         return analyze_resume(args)
@@ -400,6 +515,8 @@ def main():
         return extract_keywords(args)
     elif args.command == "full-pipeline":
         return run_full_pipeline(args)
+    elif args.command == "batch-pipeline":
+        return run_batch_pipeline(args)
     else:
         logger.error(f"Unknown command: {args.command}")
         return 1
@@ -1,38 +1,43 @@
 import os
-import yaml
+import functools
 import logging
-import sys
 from pathlib import Path
-from dotenv import load_dotenv
-from crewai import Agent, Crew, Process, Task, LLM
+from resumemaker.utils.env import load_env
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from resumemaker.tools.custom_tool import PDFAnalyzerTool
 from resumemaker.tools.opensource_rag_tool import OpenSourceRAGTool
 from resumemaker.tools.githubanalyzer_tool import GitHubFetchTool
 from resumemaker.tools.linkedin_extractor_tool import LinkedInExtractorTool
 from resumemaker.crews.poem_crew.data_extraction_output import CandidateProfile
 from resumemaker.utils.api_check import check_api_keys
-import json
+from resumemaker.utils import json_io
+from resumemaker.utils.http import configure_litellm_pool
+from resumemaker.utils.llm_cache import CachingLLM
+from resumemaker.utils.log_config import debug_enabled, configure_logging
+from resumemaker.utils.pdf_cache import get_or_extract
+from resumemaker.utils.yaml_io import load_config_sections, watch_config_dir
+from resumemaker.utils.crew_pool import CrewPool
+from resumemaker.utils.paths import INPUT_DIR, OUTPUT_DIR
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-
 # Set up paths
-BASE_DIR = Path(__file__).resolve().parent
-PROJECT_ROOT = Path(__file__).resolve().parents[4]  # 4 levels up from this file
-INPUT_DIR = PROJECT_ROOT / "input"
-OUTPUT_DIR = PROJECT_ROOT / "output"
+BASE_DIR = Path(os.path.abspath(__file__)).parent
+
+# Requests per minute allowed to the LLM provider unless config.json overrides it
+DEFAULT_MAX_RPM = 60
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_path, mtime_ns, size):
+    """Parse config.json; cached until the file's mtime or size changes"""
+    return json_io.loads(Path(config_path).read_bytes())
 
 def load_config():
     """Load configuration from config.json"""
     config_path = INPUT_DIR / "config.json"
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        st = config_path.stat()
+        return _parse_config(str(config_path), st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         logger.warning(f"Config file not found at {config_path}. Using default values.")
         return {
@@ -46,7 +51,7 @@ def load_config():
                 "temperature": 0.7
             }
         }
-    except json.JSONDecodeError:
+    except json_io.JSONDecodeError:
         logger.error(f"Error parsing config file at {config_path}. Using default values.")
         return {
             "linkedin_url": "https://www.linkedin.com/in/your-profile",
@@ -60,124 +65,163 @@ def load_config():
             }
         }
 
-# Check API keys
-if not check_api_keys():
-    logger.error("Missing required API keys. Exiting.")
-    sys.exit(1)
+@functools.lru_cache(maxsize=None)
+def _get_llm():
+    """Build the OpenRouter LLM from config.json the first time an agent needs it"""
+    load_env()
+    configure_litellm_pool()
+    config = load_config()
+    model_settings = config.get("model_settings", {
+        "provider": "openrouter",
+        "model": "meta-llama/llama-4-maverick:free",
+        "temperature": 0.7
+    })
+
+    # Set LLM configuration with OpenRouter using settings from config
+    return CachingLLM(
+        provider=model_settings.get("provider", "openrouter"),
+        model=model_settings.get("model", "meta-llama/llama-4-maverick:free"),
+        temperature=model_settings.get("temperature", 0.7),
+        api_key=os.getenv('OPENROUTER_API_KEY'),
+        api_base="https://openrouter.ai/api/v1"
+    )
+
+CONFIG_FILES = {
+    'agents': BASE_DIR / "config" / "data_extraction_agents.yaml",
+    'tasks': BASE_DIR / "config" / "data_extraction_tasks.yaml"
+}
+
+@functools.lru_cache(maxsize=1)
+def _load_configs():
+    """Load the agent and task configurations once per process"""
+    return load_config_sections(CONFIG_FILES)
 
-# Load configuration
-config = load_config()
-model_settings = config.get("model_settings", {
-    "provider": "openrouter",
-    "model": "meta-llama/llama-4-maverick:free",
-    "temperature": 0.7
-})
+def _reload_configs():
+    """Drop the cached configs and the pooled crew template built from them"""
+    _load_configs.cache_clear()
+    EXTRACTION_CREWS.invalidate()
 
-# Set LLM configuration with OpenRouter using settings from config
-llm = LLM(
-    provider=model_settings.get("provider", "openrouter"),
-    model=model_settings.get("model", "meta-llama/llama-4-maverick:free"),
-    temperature=model_settings.get("temperature", 0.7),
-    api_key=os.getenv('OPENROUTER_API_KEY'),
-    api_base="https://openrouter.ai/api/v1"
-)
+# Reload when the YAML is edited (opt-in, see watch_config_dir)
+_config_watcher = watch_config_dir(BASE_DIR / "config", _reload_configs)
+
+# Tool instances are shared by every task and crew in the process
+@functools.lru_cache(maxsize=None)
+def _linkedin_tool():
+    return LinkedInExtractorTool()
+
+@functools.lru_cache(maxsize=None)
+def _github_tool():
+    return GitHubFetchTool()
+
+@functools.lru_cache(maxsize=None)
+def _rag_tool():
+    return OpenSourceRAGTool()
 
 @CrewBase
 class DataExtraction:
-    """Data Extraction Crew with enhanced capabilities"""
+    """Data Extraction Crew with enhanced capabilities
+
+    CrewBase memoizes every @agent and @task method per instance, so the
+    repeated self.data_extraction_agent() calls and the context=[...] task
+    references below resolve to the same Agent and Task objects that crew()
+    hands to the Crew.
+    """
     
-    config_files = {
-        'agents': BASE_DIR / "config" / "data_extraction_agents.yaml",
-        'tasks': BASE_DIR / "config" / "data_extraction_tasks.yaml"
-    }
-    
-    # Load configurations
-    configs = {}
-    for key, file_path in config_files.items():
-        file_path = file_path.resolve()
-        if not file_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
-        
-        with open(file_path, 'r') as file:
-            configs[key] = yaml.safe_load(file)
+    def __init__(self):
+        # Check API keys before any agent or LLM is built
+        if not check_api_keys():
+            raise RuntimeError("Missing required API keys. Please check your .env file.")
     
     @agent
     def data_extraction_agent(self) -> Agent:
         return Agent(
             role="CrewAI Data Extraction Specialist",
-            config=self.configs["agents"]["data_extraction_agent"],
-            llm=llm,
-            verbose=True
+            config=_load_configs().agents.data_extraction_agent,
+            llm=_get_llm(),
+            verbose=debug_enabled()
+        )
+    
+    @agent
+    def linkedin_extraction_agent(self) -> Agent:
+        """Dedicated agent for the LinkedIn profile, which is extracted alongside the resume"""
+        return Agent(
+            config=_load_configs().agents.linkedin_extraction_agent,
+            llm=_get_llm(),
+            verbose=debug_enabled()
         )
     
     @agent
     def github_extraction_agent(self) -> Agent:
         """Dedicated agent for GitHub repository analysis"""
         return Agent(
-            config=self.configs["agents"]["github_extraction_agent"],
-            llm=llm,
-            verbose=True
+            config=_load_configs().agents.github_extraction_agent,
+            llm=_get_llm(),
+            verbose=debug_enabled()
         )
     
     @agent
     def job_analysis_agent(self) -> Agent:
         return Agent(
-            config=self.configs["agents"]["job_analysis_agent"],
-            llm=llm,
-            verbose=True
+            config=_load_configs().agents.job_analysis_agent,
+            llm=_get_llm(),
+            verbose=debug_enabled()
         )
     
     @agent
     def profile_structuring_agent(self) -> Agent:
         return Agent(
-            config=self.configs["agents"]["profile_structuring_agent"],
-            llm=llm,
-            verbose=True
+            config=_load_configs().agents.profile_structuring_agent,
+            llm=_get_llm(),
+            verbose=debug_enabled()
         )
     
     @task
     def extract_resume_data(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["extract_resume_data"],
+            config=_load_configs().tasks.extract_resume_data,
             agent=self.data_extraction_agent(),
+            async_execution=True
         )
 
     @task
     def extract_linkedin_data(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["extract_linkedin_data"],
-            agent=self.data_extraction_agent(),
-            tools=[LinkedInExtractorTool()]
+            config=_load_configs().tasks.extract_linkedin_data,
+            agent=self.linkedin_extraction_agent(),
+            tools=[_linkedin_tool()],
+            async_execution=True
         )
 
     @task
     def extract_github_profile(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["extract_github_data"],
+            config=_load_configs().tasks.extract_github_data,
             agent=self.github_extraction_agent(),
-            tools=[GitHubFetchTool()]
+            tools=[_github_tool()],
+            async_execution=True
         )
 
     @task
     def analyze_github_repositories(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["analyze_github_repositories"],
+            config=_load_configs().tasks.analyze_github_repositories,
             agent=self.github_extraction_agent(),
-            tools=[GitHubFetchTool()],
+            tools=[_github_tool()],
             context=[self.extract_github_profile()]
         )
 
     @task
     def analyze_job_posting(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["analyze_job_posting"],
+            config=_load_configs().tasks.analyze_job_posting,
             agent=self.job_analysis_agent(),
+            async_execution=True
         )
 
     @task
     def compare_resume_with_job(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["compare_resume_with_job"],
+            config=_load_configs().tasks.compare_resume_with_job,
             agent=self.job_analysis_agent(),
             context=[self.extract_resume_data(), self.analyze_job_posting()]
         )
@@ -185,13 +229,16 @@ class DataExtraction:
     @task
     def structure_candidate_profile(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["structure_candidate_profile"],
+            config=_load_configs().tasks.structure_candidate_profile,
             agent=self.profile_structuring_agent(),
-            tools=[OpenSourceRAGTool()],
+            tools=[_rag_tool()],
+            # analyze_github_repositories already restates everything from
+            # extract_github_profile, so the raw profile is left out to keep
+            # the prompt small. Resume data stays first so every task that
+            # sees it shares the same prompt prefix.
             context=[
                 self.extract_resume_data(),
                 self.extract_linkedin_data(),
-                self.extract_github_profile(),
                 self.analyze_github_repositories(),
                 self.analyze_job_posting(),
                 self.compare_resume_with_job()
@@ -204,24 +251,40 @@ class DataExtraction:
         return Crew(
             agents=[
                 self.data_extraction_agent(),
+                self.linkedin_extraction_agent(),
                 self.github_extraction_agent(),
                 self.job_analysis_agent(),
                 self.profile_structuring_agent()
             ],
+            # The four extraction tasks are independent and run concurrently,
+            # each on its own agent: an Agent keeps a single executor, so two
+            # of its tasks running at once would overwrite each other's. The
+            # first synchronous task waits for all of them to finish, so it
+            # can then reuse one of their agents.
+            # analyze_github_repositories and compare_resume_with_job can't
+            # also overlap: CrewAI rejects an async task whose context holds
+            # an async task from the same uninterrupted async run.
             tasks=[
                 self.extract_resume_data(),
                 self.extract_linkedin_data(),
                 self.extract_github_profile(),
-                self.analyze_github_repositories(),
                 self.analyze_job_posting(),
+                self.analyze_github_repositories(),
                 self.compare_resume_with_job(),
                 self.structure_candidate_profile()
             ],
             process=Process.sequential,
-            verbose=True
+            # Pace LLM requests to the provider's per-minute limit instead of
+            # hitting 429 backoff
+            max_rpm=load_config().get("model_settings", {}).get("max_rpm", DEFAULT_MAX_RPM),
+            verbose=debug_enabled()
         )
 
+# Built on first use; every pipeline run kicks off its own copy of the crew
+EXTRACTION_CREWS = CrewPool(lambda: DataExtraction().crew())
+
 if __name__ == "__main__":
+    configure_logging()
     try:
         # Make sure output directory exists
         OUTPUT_DIR.mkdir(exist_ok=True)
@@ -229,9 +292,8 @@ if __name__ == "__main__":
         # Load configuration
         config = load_config()
         
-        # Initialize tools and crew
+        # Initialize crew
         extraction_crew = DataExtraction().crew()
-        pdfAnalyzerTool = PDFAnalyzerTool()
 
         # Set file paths
         resume_path = INPUT_DIR / config["resume_file"]
@@ -244,7 +306,7 @@ if __name__ == "__main__":
             raise FileNotFoundError(f"Error: Job posting file '{job_posting_path}' not found.")
 
         # Extract data from files
-        read_resume = pdfAnalyzerTool._run(resume_path)
+        read_resume = get_or_extract(resume_path)
         read_jobPosting = job_posting_path.read_text(encoding="utf-8")
 
         # Get LinkedIn and GitHub info from config
@@ -271,8 +333,7 @@ if __name__ == "__main__":
         
         # Save the extracted profile
         output_file = OUTPUT_DIR / "candidate_profile.json"
-        with open(output_file, "w") as f:
-            json.dump(candidate_profile.dict(), f, indent=2)
+        output_file.write_bytes(candidate_profile.model_dump_json(indent=2).encode("utf-8"))
         
         logger.info(f"Profile saved to {output_file}")
         
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 
 
 class Experience(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     job_title: str = Field(..., description="The title of the job held.")
     company: str = Field(..., description="The name of the company where the candidate worked.")
     start_date: Optional[str] = Field(None, description="Start date of the job.")
@@ -11,18 +13,24 @@ class Experience(BaseModel):
 
 
 class Education(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     degree: str = Field(..., description="The degree obtained.")
     institution: str = Field(..., description="The name of the educational institution.")
     graduation_year: Optional[int] = Field(None, description="Year of graduation.")
 
 
 class Skills(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     technical_skills: List[str] = Field(..., description="List of technical skills such as programming languages, tools, and frameworks.")
     soft_skills: List[str] = Field(..., description="List of soft skills such as communication, teamwork, and leadership.")
     endorsements: Optional[Dict[str, int]] = Field(None, description="Endorsements from LinkedIn for specific skills.")
 
 
 class Projects(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str = Field(..., description="Project name.")
     description: str = Field(..., description="Short summary of the project.")
     technologies_used: List[str] = Field(..., description="Technologies used in the project.")
@@ -30,12 +38,16 @@ class Projects(BaseModel):
 
 
 class GitHubProfile(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     username: str = Field(..., description="GitHub username.")
     repositories: List[Projects] = Field(..., description="List of public repositories and projects.")
     contributions: Dict[str, int] = Field(..., description="Number of commits, pull requests, and issues contributed.")
 
 
 class JobPosting(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     title: str = Field(..., description="Job title in the posting.")
     company: str = Field(..., description="Company offering the job.")
     required_skills: List[str] = Field(..., description="List of required technical and soft skills.")
@@ -44,6 +56,8 @@ class JobPosting(BaseModel):
 
 
 class ResumeComparison(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     matching_skills: List[str] = Field(..., description="Skills that match between the resume and the job posting.")
     missing_skills: List[str] = Field(..., description="Skills required in the job posting but missing in the resume.")
     experience_match: str = Field(..., description="A summary of how well the candidate's experience aligns with the job posting.")
@@ -51,6 +65,8 @@ class ResumeComparison(BaseModel):
 
 
 class CandidateProfile(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str = Field(..., description="Candidate's full name.")
     email: Optional[str] = Field(None, description="Candidate's email address.")
     phone: Optional[str] = Field(None, description="Candidate's phone number.")
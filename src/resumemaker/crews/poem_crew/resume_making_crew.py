@@ -2,107 +2,144 @@ import warnings
 warnings.filterwarnings('ignore')
 
 import os
-import yaml
+import functools
 import logging
+import threading
 import json
 from pathlib import Path
-from dotenv import load_dotenv
-from crewai import Agent, Crew, Process, Task, LLM
+from resumemaker.utils.env import load_env
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from resumemaker.tools.opensource_rag_tool import OpenSourceRAGTool
+from resumemaker.tools.opensource_rag_tool import OpenSourceRAGTool, warm_up as warm_up_rag
 from resumemaker.tools.image_processing_tool import ImageProcessingTool
 from resumemaker.tools.latex_generator_tool import LaTeXGeneratorTool
+from resumemaker.utils import json_io
+from resumemaker.utils.http import configure_litellm_pool
+from resumemaker.utils.llm_cache import CachingLLM
+from resumemaker.utils.log_config import debug_enabled, configure_logging
+from resumemaker.utils.yaml_io import load_config_sections, watch_config_dir
+from resumemaker.utils.crew_pool import CrewPool
+from resumemaker.utils.paths import INPUT_DIR, OUTPUT_DIR
 
-# Setup logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-
 # Configure LLM
-# class CustomLLM(LLM):
-#     def call(self, messages, **kwargs):
-#         if messages and messages[-1]["role"] == "assistant":
-#             messages.append({"role": "user", "content": "Please continue with the resume creation."})
-#         return super().call(messages, **kwargs)
+@functools.lru_cache(maxsize=None)
+def _get_llm():
+    """Build the Gemini LLM the first time an agent needs it"""
+    load_env()
+    configure_litellm_pool()
+    api_key = os.getenv('GEMINI_API_KEY')
+    if not api_key:
+        raise RuntimeError("Set GEMINI_API_KEY in your environment or .env file.")
+    return CachingLLM(
+        model="gemini/gemini-1.5-pro-latest",
+        temperature=0.7,
+        api_key=api_key
+    )
 
-# llm = CustomLLM(
-#     model="mistral/mistral-large-latest",
-#     temperature=0.3,
-#     api_key=os.getenv('MISTRAL_API_KEY'),
-# )
+# Set up paths
+BASE_DIR = Path(os.path.abspath(__file__)).parent
 
+CONFIG_FILES = {
+    'agents': BASE_DIR / "config" / "resume_creation_agents.yaml",
+    'tasks': BASE_DIR / "config" / "resume_creation_tasks.yaml"
+}
 
-llm = LLM(
-    model="gemini/gemini-1.5-pro-latest",
-    temperature=0.7,
-    api_key= os.getenv('GEMINI_API_KEY')
-)
+@functools.lru_cache(maxsize=1)
+def _load_configs():
+    """Load the agent and task configurations the first time the crew is built"""
+    return load_config_sections(CONFIG_FILES)
 
-# Set up paths
-BASE_DIR = Path(__file__).resolve().parent
-PROJECT_ROOT = Path(__file__).resolve().parents[4]  # 4 levels up from this file
-INPUT_DIR = PROJECT_ROOT / "input"
-OUTPUT_DIR = PROJECT_ROOT / "output"
+def _reload_configs():
+    """Drop the cached configs and the pooled crew template built from them"""
+    _load_configs.cache_clear()
+    RESUME_CREWS.invalidate()
+
+# Reload when the YAML is edited (opt-in, see watch_config_dir)
+_config_watcher = watch_config_dir(BASE_DIR / "config", _reload_configs)
+
+# Tool instances are shared by every task and crew in the process
+@functools.lru_cache(maxsize=None)
+def _rag_tool():
+    return OpenSourceRAGTool()
+
+@functools.lru_cache(maxsize=None)
+def _image_tool():
+    return ImageProcessingTool()
+
+@functools.lru_cache(maxsize=None)
+def _latex_tool():
+    return LaTeXGeneratorTool()
+
+def _warm_up_embeddings():
+    try:
+        warm_up_rag()
+    except Exception as e:
+        logger.debug(f"Embedding model warm-up failed: {str(e)}")
+
+def warm_up_tools():
+    """Start loading the RAG tool's embedding model in the background
+
+    The model takes seconds to load on first use. Calling this at pipeline
+    start hides that behind the data extraction crew's LLM calls. The thread
+    is a daemon so it never holds up interpreter exit, and errors are left
+    for the crew to hit when it actually uses the tool.
+    """
+    threading.Thread(target=_warm_up_embeddings, name="embeddings-warmup", daemon=True).start()
 
 @CrewBase
 class LaTeXResumeCreation:
-    """High ATS-Friendly LaTeX Resume Creation Crew"""
-    
-    config_files = {
-        'agents': BASE_DIR / "config" / "resume_creation_agents.yaml",
-        'tasks': BASE_DIR / "config" / "resume_creation_tasks.yaml"
-    }
-    
-    configs = {}
-    for key, file_path in config_files.items():
-        file_path = file_path.resolve()
-        if not file_path.exists():
-            logger.warning(f"Config file not found at {file_path}. Ensure the file exists.")
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
-        with open(file_path, 'r') as file:
-            configs[key] = yaml.safe_load(file)
+    """High ATS-Friendly LaTeX Resume Creation Crew
+
+    Agents and tasks are built once per crew instance: the @agent and @task
+    decorators cache their result, so an agent shared by several tasks and
+    the agents=[...] list is a single object.
+    """
     
     # Define Agents
     @agent
     def ats_optimization_agent(self) -> Agent:
-        return Agent(config=self.configs["agents"]["ats_optimization_agent"], llm=llm, verbose=True)
+        return Agent(config=_load_configs().agents.ats_optimization_agent, llm=_get_llm(), verbose=debug_enabled())
     
     @agent
     def resume_content_agent(self) -> Agent:
-        return Agent(config=self.configs["agents"]["resume_content_agent"], llm=llm, verbose=True)
+        return Agent(config=_load_configs().agents.resume_content_agent, llm=_get_llm(), verbose=debug_enabled())
     
     @agent
     def latex_resume_agent(self) -> Agent:
-        return Agent(config=self.configs["agents"]["latex_resume_agent"], llm=llm, verbose=True)
+        return Agent(config=_load_configs().agents.latex_resume_agent, llm=_get_llm(), verbose=debug_enabled())
     
     @agent
     def image_processing_agent(self) -> Agent:
-        return Agent(config=self.configs["agents"]["image_processing_agent"], llm=llm, verbose=True)
+        return Agent(config=_load_configs().agents.image_integration_agent, llm=_get_llm(), verbose=debug_enabled())
 
     @agent
     def resume_compilation_agent(self) -> Agent:
-        return Agent(config=self.configs["agents"]["resume_compilation_agent"], llm=llm, verbose=True)
+        return Agent(config=_load_configs().agents.resume_compilation_agent, llm=_get_llm(), verbose=debug_enabled())
     
     # Define Tasks
     @task
     def analyze_candidate_profile(self) -> Task:
-        return Task(config=self.configs["tasks"]["analyze_candidate_profile"], agent=self.resume_content_agent())
+        return Task(
+            config=_load_configs().tasks.analyze_candidate_profile,
+            agent=self.resume_content_agent(),
+            async_execution=True
+        )
     
     @task
     def identify_keywords_for_ats(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["identify_keywords_for_ats"],
+            config=_load_configs().tasks.identify_keywords_for_ats,
             agent=self.ats_optimization_agent(),
-            tools=[OpenSourceRAGTool()],
+            tools=[_rag_tool()],
             context=[self.analyze_candidate_profile()]
         )
     
     @task
     def craft_resume_sections(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["craft_resume_sections"],
+            config=_load_configs().tasks.craft_resume_sections,
             agent=self.resume_content_agent(),
             context=[self.analyze_candidate_profile(), self.identify_keywords_for_ats()]
         )
@@ -110,35 +147,36 @@ class LaTeXResumeCreation:
     @task
     def process_profile_image(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["process_profile_image"],
+            config=_load_configs().tasks.process_profile_image,
             agent=self.image_processing_agent(),
-            tools=[ImageProcessingTool()]
+            tools=[_image_tool()],
+            async_execution=True
         )
     
     @task
     def create_latex_template(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["create_latex_template"],
+            config=_load_configs().tasks.create_latex_template,
             agent=self.latex_resume_agent(),
-            tools=[OpenSourceRAGTool()],
+            tools=[_rag_tool()],
             context=[self.craft_resume_sections()]
         )
     
     @task
     def generate_latex_resume(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["generate_latex_resume"],
+            config=_load_configs().tasks.generate_latex_resume,
             agent=self.latex_resume_agent(),
-            tools=[LaTeXGeneratorTool()],
+            tools=[_latex_tool()],
             context=[self.craft_resume_sections(), self.process_profile_image(), self.create_latex_template()]
         )
     
     @task
     def compile_final_resume(self) -> Task:
         return Task(
-            config=self.configs["tasks"]["compile_final_resume"],
+            config=_load_configs().tasks.compile_final_resume,
             agent=self.resume_compilation_agent(),
-            tools=[LaTeXGeneratorTool()],
+            tools=[_latex_tool()],
             context=[self.generate_latex_resume()]
         )
     
@@ -152,31 +190,35 @@ class LaTeXResumeCreation:
                 self.image_processing_agent(),
                 self.resume_compilation_agent()
             ],
+            # The image task only needs the raw image, so it runs alongside
+            # the profile analysis; identify_keywords_for_ats waits for both.
+            # The rest of the content chain can't overlap with it because
+            # each step takes the previous one as context.
             tasks=[
+                self.process_profile_image(),
                 self.analyze_candidate_profile(),
                 self.identify_keywords_for_ats(),
                 self.craft_resume_sections(),
-                self.process_profile_image(),
                 self.create_latex_template(),
                 self.generate_latex_resume(),
                 self.compile_final_resume()
             ],
             process=Process.sequential,
-            verbose=True
+            verbose=debug_enabled()
         )
 
+# Built on first use; every pipeline run kicks off its own copy of the crew
+RESUME_CREWS = CrewPool(lambda: LaTeXResumeCreation().crew())
+
 if __name__ == "__main__":
+    configure_logging()
     try:
         # Make sure output directory exists
         OUTPUT_DIR.mkdir(exist_ok=True)
         
         # Load Candidate Profile
         profile_path = INPUT_DIR / "candidate_profile.json"
-        if not profile_path.exists():
-            raise FileNotFoundError(f"Error: Candidate profile file '{profile_path}' not found.")
-        
-        with open(profile_path, 'r') as f:
-            candidate_profile = json.load(f)["json_dict"]  # Use the 'json_dict' section
+        candidate_profile = json_io.load_profile(profile_path)["json_dict"]  # Use the 'json_dict' section
         
         # Load Profile Image
         profile_image_path = INPUT_DIR / "bishwanath.jpg"
@@ -1,33 +1,33 @@
 #!/usr/bin/env python
 import os
+import asyncio
 import logging
-import json
-from pathlib import Path
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from resumemaker.utils.env import load_env
 
-from resumemaker.crews.poem_crew.data_extraction_crew import DataExtraction
-from resumemaker.crews.poem_crew.resume_making_crew import LaTeXResumeCreation
-from resumemaker.tools.custom_tool import PDFAnalyzerTool
+from resumemaker.crews.poem_crew.data_extraction_crew import EXTRACTION_CREWS
+from resumemaker.crews.poem_crew.resume_making_crew import RESUME_CREWS, warm_up_tools
+from resumemaker.tools.latex_generator_tool import OUTPUT_STEM
+from resumemaker.utils.pdf_cache import get_or_extract
+from resumemaker.utils.extraction_cache import extraction_key, get_cached_profile, cache_profile
 from resumemaker.utils.api_check import check_api_keys
+from resumemaker.utils.log_config import configure_logging
+from resumemaker.utils import json_io
+from resumemaker.utils.paths import INPUT_DIR, OUTPUT_DIR
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Load environment variables
-load_dotenv()
+load_env()
 
-# Set up paths
-PROJECT_ROOT = Path(__file__).resolve().parents[3]  # 3 levels up from this file
-INPUT_DIR = PROJECT_ROOT / "input"
-OUTPUT_DIR = PROJECT_ROOT / "output"
+# Candidates processed at once by complete_resume_pipeline_batch
+DEFAULT_PARALLEL = 4
 
 def load_config():
     """Load configuration from config.json"""
     config_path = INPUT_DIR / "config.json"
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return json_io.loads(config_path.read_bytes())
     except FileNotFoundError:
         logger.warning(f"Config file not found at {config_path}. Using default values.")
         return {
@@ -42,14 +42,29 @@ def load_config():
             }
         }
 
-def complete_resume_pipeline():
-    """Full pipeline that integrates both data extraction and resume creation"""
+async def _read_inputs(resume_path, job_posting_path):
+    """Extract the resume text and read the job posting concurrently"""
+    return await asyncio.gather(
+        asyncio.to_thread(get_or_extract, resume_path),
+        asyncio.to_thread(job_posting_path.read_text, encoding="utf-8")
+    )
+
+def complete_resume_pipeline(reuse_extraction=True):
+    """Full pipeline that integrates both data extraction and resume creation
+
+    When the resume, job posting and config are unchanged since an earlier
+    run, the cached candidate profile is reused and only the resume crew
+    runs. Pass reuse_extraction=False to always re-extract.
+    """
     try:
         # Check API keys
         if not check_api_keys():
             logger.error("Missing required API keys. Exiting.")
             return False
 
+        # Load the resume crew's tools while data extraction runs
+        warm_up_tools()
+
         # Make sure output directory exists
         OUTPUT_DIR.mkdir(exist_ok=True)
         
@@ -68,39 +83,45 @@ def complete_resume_pipeline():
             raise FileNotFoundError(f"Error: Job posting file '{job_posting_path}' not found.")
 
         # 1. Extract data using the data extraction crew
-        logger.info("Starting data extraction process...")
-        
-        # Initialize tools and extraction crew
-        extraction_crew = DataExtraction().crew()
-        pdf_analyzer = PDFAnalyzerTool()
-        
-        # Extract data from files
-        read_resume = pdf_analyzer._run(resume_path)
-        read_job_posting = job_posting_path.read_text(encoding="utf-8")
-        
-        # Run the data extraction crew
-        extraction_result = extraction_crew.kickoff(
-            inputs={
-                "resume_details": read_resume,
-                "linkedin_url": config["linkedin_url"],
-                "github_url": config["github_url"],
-                "job_posting": read_job_posting
-            }
-        )
+        inputs_key = extraction_key(resume_path, job_posting_path, config)
+        profile_dict = get_cached_profile(inputs_key) if reuse_extraction else None
+
+        if profile_dict is not None:
+            logger.info("Inputs unchanged since an earlier run; reusing its candidate profile.")
+        else:
+            logger.info("Starting data extraction process...")
+            
+            # Extract the resume text in a worker thread while the job posting
+            # is read. A thread rather than asyncio.run, which fails when the
+            # caller is already inside an event loop.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                resume_future = pool.submit(get_or_extract, resume_path)
+                read_job_posting = job_posting_path.read_text(encoding="utf-8")
+                read_resume = resume_future.result()
+            
+            # Run the data extraction crew
+            with EXTRACTION_CREWS.crew() as extraction_crew:
+                extraction_result = extraction_crew.kickoff(
+                    inputs={
+                        "resume_details": read_resume,
+                        "linkedin_url": config["linkedin_url"],
+                        "github_url": config["github_url"],
+                        "job_posting": read_job_posting
+                    }
+                )
+            # Dump once and reuse the dict for the file, the cache and the resume crew
+            profile_dict = extraction_result.model_dump()
+            cache_profile(inputs_key, profile_dict)
         
         # Save the extracted candidate profile
         candidate_profile_path = OUTPUT_DIR / "candidate_profile.json"
-        with open(candidate_profile_path, 'w') as f:
-            json.dump(extraction_result.dict(), f, indent=2)
+        candidate_profile_path.write_bytes(json_io.dumps(profile_dict))
         
         logger.info(f"✅ Data extraction completed. Profile saved to {candidate_profile_path}")
         
         # 2. Create resume using the resume making crew
         logger.info("Starting resume creation process...")
         
-        # Initialize resume crew
-        resume_crew = LaTeXResumeCreation().crew()
-        
         # Check if profile image exists
         if not profile_image_path.exists():
             logger.warning(f"Profile image not found at '{profile_image_path}'. Resume will be created without an image.")
@@ -109,16 +130,17 @@ def complete_resume_pipeline():
             profile_image = str(profile_image_path)
         
         # Run the resume creation crew
-        final_resume = resume_crew.kickoff(
-            inputs={
-                "candidate_profile": extraction_result.dict(),
-                "profile_image": profile_image,
-                "ats_optimization_level": "high",
-                "resume_style": "professional",
-                "latex_class": "moderncv",
-                "latex_color_theme": "black"
-            }
-        )
+        with RESUME_CREWS.crew() as resume_crew:
+            final_resume = resume_crew.kickoff(
+                inputs={
+                    "candidate_profile": profile_dict,
+                    "profile_image": profile_image,
+                    "ats_optimization_level": "high",
+                    "resume_style": "professional",
+                    "latex_class": "moderncv",
+                    "latex_color_theme": "black"
+                }
+            )
         
         logger.info("✅ High ATS-friendly LaTeX resume creation completed successfully!")
         logger.info(f"📄 Final resume PDF saved to: {final_resume}")
@@ -132,9 +154,118 @@ def complete_resume_pipeline():
         logger.error(f"❌ Error during resume creation pipeline: {str(e)}")
         return False
 
+async def _run_candidate(config, semaphore, reuse_extraction):
+    """Extract one candidate's profile and build their resume, sharing the semaphore"""
+    async with semaphore:
+        resume_path = INPUT_DIR / config["resume_file"]
+        job_posting_path = INPUT_DIR / config["job_description_file"]
+        if not resume_path.exists():
+            raise FileNotFoundError(f"Error: Resume file '{resume_path}' not found.")
+        if not job_posting_path.exists():
+            raise FileNotFoundError(f"Error: Job posting file '{job_posting_path}' not found.")
+
+        logger.info(f"Starting pipeline for {resume_path.name}...")
+
+        # Each gathered candidate runs in its own context, so this only names
+        # this candidate's .tex and .pdf
+        OUTPUT_STEM.set(f"{resume_path.stem}_resume")
+
+        inputs_key = extraction_key(resume_path, job_posting_path, config)
+        profile_dict = get_cached_profile(inputs_key) if reuse_extraction else None
+
+        if profile_dict is None:
+            read_resume, read_job_posting = await _read_inputs(resume_path, job_posting_path)
+
+            # Concurrent candidates each kick off their own copy of the crew
+            with EXTRACTION_CREWS.crew() as extraction_crew:
+                extraction_result = await extraction_crew.kickoff_async(
+                    inputs={
+                        "resume_details": read_resume,
+                        "linkedin_url": config.get("linkedin_url", ""),
+                        "github_url": config.get("github_url", ""),
+                        "job_posting": read_job_posting
+                    }
+                )
+            # Dump once and reuse the dict for the file, the cache and the resume crew
+            profile_dict = extraction_result.model_dump()
+            cache_profile(inputs_key, profile_dict)
+
+        candidate_profile_path = OUTPUT_DIR / f"{resume_path.stem}_candidate_profile.json"
+        candidate_profile_path.write_bytes(json_io.dumps(profile_dict))
+        logger.info(f"✅ Profile for {resume_path.name} saved to {candidate_profile_path}")
+
+        profile_image_path = INPUT_DIR / config["profile_image_file"] if config.get("profile_image_file") else None
+        profile_image = str(profile_image_path) if profile_image_path and profile_image_path.exists() else None
+
+        with RESUME_CREWS.crew() as resume_crew:
+            return await resume_crew.kickoff_async(
+                inputs={
+                    "candidate_profile": profile_dict,
+                    "profile_image": profile_image,
+                    "ats_optimization_level": "high",
+                    "resume_style": "professional",
+                    "latex_class": "moderncv",
+                    "latex_color_theme": "black"
+                }
+            )
+
+async def _run_batch(configs, n_parallel, reuse_extraction):
+    semaphore = asyncio.Semaphore(n_parallel)
+    return await asyncio.gather(
+        *(_run_candidate(config, semaphore, reuse_extraction) for config in configs),
+        return_exceptions=True
+    )
+
+def complete_resume_pipeline_batch(configs, n_parallel=DEFAULT_PARALLEL, reuse_extraction=True):
+    """Run the full pipeline for several candidates, overlapping their LLM calls
+
+    configs is a list of dicts in the same shape as config.json, optionally
+    with a "profile_image_file" entry. At most n_parallel candidates run at
+    once to stay clear of provider rate limits. Each candidate's resume is
+    written to output/<resume stem>_resume.tex and .pdf. model_settings come
+    from input/config.json; a batch config that sets different ones fails
+    the whole batch before anything runs. Crew.kickoff_for_each is
+    sequential, so the async kickoffs are gathered here instead. As with
+    complete_resume_pipeline, unchanged inputs reuse their cached profile.
+    Returns the number of candidates that failed.
+    """
+    if not check_api_keys():
+        logger.error("Missing required API keys. Exiting.")
+        return len(configs)
+
+    # The extraction crew's LLM is built once per process from input/config.json
+    model_settings = load_config().get("model_settings")
+    overriding = [config.get("resume_file") for config in configs if config.get("model_settings", model_settings) != model_settings]
+    if overriding:
+        logger.error(f"model_settings can't differ per candidate; set them in input/config.json instead (found in configs for {', '.join(map(str, overriding))})")
+        return len(configs)
+
+    warm_up_tools()
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    results = asyncio.run(_run_batch(configs, max(1, n_parallel), reuse_extraction))
+
+    failures = 0
+    for config, result in zip(configs, results):
+        if isinstance(result, Exception):
+            failures += 1
+            logger.error(f"❌ Pipeline failed for {config.get('resume_file')}: {str(result)}")
+        else:
+            logger.info(f"📄 Resume for {config.get('resume_file')} saved to: {result}")
+    return failures
+
 def kickoff():
     """Main entry point for the application"""
+    configure_logging()
     complete_resume_pipeline()
 
+async def kickoff_async():
+    """Run the pipeline from async code without blocking the event loop
+
+    The crews are synchronous and take minutes, so the pipeline runs in a
+    worker thread. kickoff() remains the command-line entry point.
+    """
+    return await asyncio.to_thread(complete_resume_pipeline)
+
 if __name__ == "__main__":
     kickoff()
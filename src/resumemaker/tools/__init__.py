@@ -1,63 +1,29 @@
-import logging
-
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-# Standard tools that should always be available
-from resumemaker.tools.custom_tool import PDFAnalyzerTool
-from resumemaker.tools.pdf_analyzer_tool import PDFAnalyzerTool
-from resumemaker.tools.opensource_rag_tool import OpenSourceRAGTool
-
-# Tools that may have additional dependencies - try to import them safely
-tools_list = ["PDFAnalyzerTool", "OpenSourceRAGTool"]
-
-try:
-    from resumemaker.tools.linkedin_extractor_tool import LinkedInExtractorTool
-    tools_list.append("LinkedInExtractorTool")
-except ImportError as e:
-    logger.warning(f"Could not import LinkedInExtractorTool: {str(e)}")
-
-try:
-    from resumemaker.tools.githubanalyzer_tool import GitHubFetchTool
-    tools_list.append("GitHubFetchTool")
-except ImportError as e:
-    logger.warning(f"Could not import GitHubFetchTool: {str(e)}")
-
-try:
-    from resumemaker.tools.mistral_pdf_upload_tool import MistralPDFUploadTool
-    tools_list.append("MistralPDFUploadTool")
-except ImportError as e:
-    logger.warning(f"Could not import MistralPDFUploadTool: {str(e)}")
-
-try:
-    from resumemaker.tools.image_processing_tool import ImageProcessingTool
-    tools_list.append("ImageProcessingTool")
-except ImportError as e:
-    logger.warning(f"Could not import ImageProcessingTool: {str(e)}")
-
-try:
-    from resumemaker.tools.latex_generator_tool import LaTeXGeneratorTool
-    tools_list.append("LaTeXGeneratorTool")
-except ImportError as e:
-    logger.warning(f"Could not import LaTeXGeneratorTool: {str(e)}")
-
-try:
-    from resumemaker.tools.job_keyword_extractor_tool import JobKeywordExtractorTool
-    tools_list.append("JobKeywordExtractorTool")
-except ImportError as e:
-    logger.warning(f"Could not import JobKeywordExtractorTool: {str(e)}")
-
-try:
-    from resumemaker.tools.resume_analyzer_tool import ResumeAnalyzerTool
-    tools_list.append("ResumeAnalyzerTool")
-except ImportError as e:
-    logger.warning(f"Could not import ResumeAnalyzerTool: {str(e)}")
-
-try:
-    from resumemaker.tools.template_manager_tool import TemplateManagerTool
-    tools_list.append("TemplateManagerTool")
-except ImportError as e:
-    logger.warning(f"Could not import TemplateManagerTool: {str(e)}")
-
-__all__ = tools_list
\ No newline at end of file
+import importlib
+
+# Tools are imported on first access (PEP 562) so that importing one tool
+# module doesn't also pull in the RAG stack, Selenium, PIL and the rest.
+# Tools with optional dependencies raise ImportError only when used.
+_LAZY = {
+    "PDFAnalyzerTool": "resumemaker.tools.pdf_analyzer_tool",
+    "OpenSourceRAGTool": "resumemaker.tools.opensource_rag_tool",
+    "LinkedInExtractorTool": "resumemaker.tools.linkedin_extractor_tool",
+    "GitHubFetchTool": "resumemaker.tools.githubanalyzer_tool",
+    "MistralPDFUploadTool": "resumemaker.tools.mistral_pdf_upload_tool",
+    "ImageProcessingTool": "resumemaker.tools.image_processing_tool",
+    "LaTeXGeneratorTool": "resumemaker.tools.latex_generator_tool",
+    "JobKeywordExtractorTool": "resumemaker.tools.job_keyword_extractor_tool",
+    "ResumeAnalyzerTool": "resumemaker.tools.resume_analyzer_tool",
+    "TemplateManagerTool": "resumemaker.tools.template_manager_tool",
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,14 +4,26 @@
 # - MistralRAGTool -> replaced by OpenSourceRAGTool in opensource_rag_tool.py
 # - PDFAnalyzerTool -> pdf_analyzer_tool.py
 
-# Import and re-export the tools for backwards compatibility
-from resumemaker.tools.mistral_pdf_upload_tool import MistralPDFUploadTool
-from resumemaker.tools.opensource_rag_tool import OpenSourceRAGTool
-from resumemaker.tools.pdf_analyzer_tool import PDFAnalyzerTool
+import warnings
 
-# Re-export for backwards compatibility
-__all__ = [
+warnings.warn(
+    "resumemaker.tools.custom_tool is deprecated; import tools from their own modules or from resumemaker.tools",
+    DeprecationWarning,
+    stacklevel=2
+)
+
+# Re-exported lazily through resumemaker.tools, so importing this shim
+# doesn't load the RAG stack unless OpenSourceRAGTool is actually used
+from resumemaker import tools as _tools
+
+# Resolved by __getattr__ below, which linters can't see
+__all__ = [  # noqa: F822
     "MistralPDFUploadTool", 
     "OpenSourceRAGTool",
     "PDFAnalyzerTool"
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_tools, name)
@@ -1,22 +1,121 @@
 import os
 import time
+import hashlib
 import logging
-import random
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Any, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
-from dotenv import load_dotenv
+from resumemaker.utils.env import load_env
+from resumemaker.utils.http import get_session, REQUEST_TIMEOUT
+from resumemaker.utils import json_io
+from resumemaker.utils.paths import CACHE_ROOT
 
-# Logger setup
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Load environment variables
-load_dotenv()
+load_env()
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 API_BASE_URL = "https://api.github.com"
-MAX_RETRIES = 10
+GRAPHQL_URL = f"{API_BASE_URL}/graphql"
+# Built once; unauthenticated requests work too, at a lower rate limit
+HEADERS = {"Accept": "application/vnd.github+json"}
+if GITHUB_TOKEN:
+    HEADERS["Authorization"] = f"token {GITHUB_TOKEN}"
+# 429s and 5xx are retried by the shared session; an exhausted primary rate
+# limit is a 403 instead, waited out only when its reset is this close (seconds)
+MAX_RATE_LIMIT_WAIT = 60
+MAX_WORKERS = 8  # concurrent per-repo requests, kept under GitHub's secondary rate limits
+# Fetched projects are reused across runs for a day; each fetch costs one
+# request per repo against a 60/hour limit when unauthenticated
+CACHE_DIR = CACHE_ROOT / "github"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+# REST responses kept with their ETag; revalidating them returns an empty 304
+# that doesn't count against the rate limit when nothing has changed
+ETAG_DIR = CACHE_DIR / "etags"
+
+def _get(url) -> bytes:
+    """GET a GitHub API URL and return its body, revalidating any cached copy by ETag
+
+    Sleeps until the rate-limit reset if it is imminent.
+    """
+    entry = ETAG_DIR / hashlib.sha256(url.encode("utf-8")).hexdigest()
+    try:
+        etag = entry.with_suffix(".etag").read_text()
+        cached_body = entry.with_suffix(".body").read_bytes()
+    except OSError:
+        etag, cached_body = None, None
+    headers = {**HEADERS, "If-None-Match": etag} if etag else HEADERS
+
+    response = get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0":
+        wait = max(0, int(response.headers.get("X-RateLimit-Reset", 0)) - time.time())
+        if wait <= MAX_RATE_LIMIT_WAIT:
+            logger.warning(f"GitHub rate limit reached; retrying in {wait:.0f}s")
+            time.sleep(wait)
+            response = get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        return cached_body
+    response.raise_for_status()
+
+    if "ETag" in response.headers:
+        try:
+            ETAG_DIR.mkdir(parents=True, exist_ok=True)
+            entry.with_suffix(".body").write_bytes(response.content)
+            entry.with_suffix(".etag").write_text(response.headers["ETag"])
+        except OSError as e:
+            logger.warning(f"Could not cache GitHub response: {str(e)}")
+    return response.content
+
+# Repos and their root file names in one round trip, instead of one contents
+# request per repo. GraphQL needs a token, so unauthenticated runs use REST.
+REPOS_QUERY = """
+query($login: String!, $first: Int!) {
+  user(login: $login) {
+    repositories(first: $first, isFork: false, ownerAffiliations: OWNER, orderBy: {field: NAME, direction: ASC}) {
+      nodes {
+        name
+        description
+        url
+        primaryLanguage { name }
+        object(expression: "HEAD:") { ... on Tree { entries { name } } }
+      }
+    }
+  }
+}
+"""
+
+def _graphql(query, variables):
+    """POST a GraphQL query and return its data, raising on query errors"""
+    response = get_session().post(
+        GRAPHQL_URL, json={"query": query, "variables": variables}, headers=HEADERS, timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    payload = json_io.loads(response.content)
+    if payload.get("errors"):
+        raise ValueError("; ".join(error["message"] for error in payload["errors"]))
+    return payload["data"]
+
+# Root-level manifest files and the technology each indicates; add more detections here
+TECH_STACK_FILES = {
+    "package.json": "JavaScript/Node.js",
+    "requirements.txt": "Python",
+    "pyproject.toml": "Python",
+    "Gemfile": "Ruby on Rails",
+    "go.mod": "Go",
+    "Cargo.toml": "Rust",
+    "pom.xml": "Java/Maven",
+    "build.gradle": "Java/Gradle",
+    "Dockerfile": "Docker",
+}
+
+def _tech_stack(file_names) -> List[str]:
+    """Map a repository's root file names to the technologies they indicate"""
+    # Exact matches, so e.g. old-package.json isn't mistaken for a manifest;
+    # dict.fromkeys drops repeats such as Python from two manifests
+    return list(dict.fromkeys(TECH_STACK_FILES[name] for name in file_names if name in TECH_STACK_FILES))
 
 class GitHubFetchInput(BaseModel):
     """Input schema for GitHubFetchTool."""
@@ -30,31 +129,42 @@ class GitHubFetchTool(BaseTool):
 
     def _run(self, username: str, max_repos: int = 10) -> Dict[str, Any]:
         """Fetch GitHub project details and tech stack for a given username."""
-        headers = {"Authorization": f"token {GITHUB_TOKEN}", "Accept": "application/vnd.github+json"}
-        user_url = f"{API_BASE_URL}/users/{username}"
+        cache_path = CACHE_DIR / f"{username.lower()}_{max_repos}.json"
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            logger.info(f"Using cached GitHub projects for {username}")
+            return cached
+
+        result = self._fetch(username, max_repos)
+        # Errors are often transient (rate limits, timeouts), so only successes are kept
+        if "error" not in result:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(json_io.dumps(result, indent=False))
+            except OSError as e:
+                logger.warning(f"Could not cache GitHub projects: {str(e)}")
+        return result
 
+    def _load_cached(self, cache_path: Path):
+        """Return the cached result at cache_path if it is younger than the TTL"""
         try:
-            user_response = requests.get(user_url, headers=headers)
-            user_response.raise_for_status()
-            user_data = user_response.json()
-            
-            repos_url = f"{user_data['repos_url']}?per_page={max_repos}"
-            repos_response = requests.get(repos_url, headers=headers)
-            repos_response.raise_for_status()
-            repos_data = repos_response.json()
-            
-            projects = []
-            for repo in repos_data:
-                if not repo["fork"]:
-                    project_data = {
-                        "name": repo["name"],
-                        "description": repo["description"] or "No description",
-                        "url": repo["html_url"],
-                        "tech_stack": self.detect_tech_stack(repo["full_name"]),
-                        "language": repo.get("language"),
-                    }
-                    projects.append(project_data)
-                    logger.info(f"Processed repository: {repo['name']}")
+            if time.time() - cache_path.stat().st_mtime > CACHE_TTL_SECONDS:
+                return None
+            return json_io.loads(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable GitHub cache entry {cache_path.name}: {str(e)}")
+            return None
+
+    def _fetch(self, username: str, max_repos: int) -> Dict[str, Any]:
+        try:
+            if GITHUB_TOKEN:
+                projects = self._fetch_projects_graphql(username, max_repos)
+            else:
+                projects = self._fetch_projects_rest(username, max_repos)
+            for project in projects:
+                logger.info(f"Processed repository: {project['name']}")
 
             return {"projects": projects}
         
@@ -65,26 +175,51 @@ class GitHubFetchTool(BaseTool):
             logger.error(f"Error fetching GitHub projects: {str(e)}")
             return {"error": f"Error fetching GitHub projects: {str(e)}"}
     
+    def _fetch_projects_graphql(self, username: str, max_repos: int) -> List[Dict[str, Any]]:
+        data = _graphql(REPOS_QUERY, {"login": username, "first": max_repos})
+        projects = []
+        for repo in data["user"]["repositories"]["nodes"]:
+            # object is null for empty repositories
+            entries = (repo.get("object") or {}).get("entries", [])
+            projects.append({
+                "name": repo["name"],
+                "description": repo["description"] or "No description",
+                "url": repo["url"],
+                "tech_stack": _tech_stack(entry["name"] for entry in entries),
+                "language": (repo.get("primaryLanguage") or {}).get("name"),
+            })
+        return projects
+
+    def _fetch_projects_rest(self, username: str, max_repos: int) -> List[Dict[str, Any]]:
+        # The repos endpoint 404s for unknown users too, so there's no need
+        # to fetch the user record first just to read its repos_url
+        repos_url = f"{API_BASE_URL}/users/{username}/repos?per_page={max_repos}"
+        repos_data = json_io.loads(_get(repos_url))
+
+        repos = [repo for repo in repos_data if not repo["fork"]]
+        # Tech stack detection is one request per repo; run them concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(repos)))) as executor:
+            tech_stacks = list(executor.map(self.detect_tech_stack, [repo["full_name"] for repo in repos]))
+
+        return [
+            {
+                "name": repo["name"],
+                "description": repo["description"] or "No description",
+                "url": repo["html_url"],
+                "tech_stack": tech_stack,
+                "language": repo.get("language"),
+            }
+            for repo, tech_stack in zip(repos, tech_stacks)
+        ]
+
     def detect_tech_stack(self, full_repo_name: str) -> List[str]:
         """Detect technologies used in the repository."""
-        headers = {"Authorization": f"token {GITHUB_TOKEN}", "Accept": "application/vnd.github+json"}
         tech_stack = []
         
         try:
             contents_url = f"{API_BASE_URL}/repos/{full_repo_name}/contents"
-            contents_response = requests.get(contents_url, headers=headers)
-            contents_response.raise_for_status()
-            contents_data = contents_response.json()
-            
-            # Implement tech stack detection logic based on repo contents
-            for file in contents_data:
-                if "package.json" in file["name"]:
-                    tech_stack.append("JavaScript/Node.js")
-                elif "requirements.txt" in file["name"]:
-                    tech_stack.append("Python")
-                elif "Gemfile" in file["name"]:
-                    tech_stack.append("Ruby on Rails")
-                # Add more detections as needed
+            contents_data = json_io.loads(_get(contents_url))
+            tech_stack = _tech_stack(file["name"] for file in contents_data)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error detecting tech stack for {full_repo_name}: {str(e)}")
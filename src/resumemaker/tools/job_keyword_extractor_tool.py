@@ -1,12 +1,49 @@
 import re
 import logging
+import threading
 from typing import Type, Dict, Any, List
-from collections import Counter
+from collections import Counter, OrderedDict
+from heapq import nlargest
+from operator import itemgetter
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
+from resumemaker.utils import json_io
 
 logger = logging.getLogger(__name__)
 
+# Results are a pure function of the arguments, and agents often repeat a call
+MAX_CACHED_RESULTS = 128
+_results = OrderedDict()
+_results_lock = threading.Lock()
+
+SOFT_SKILLS = (
+    "communication", "teamwork", "leadership", "problem solving", 
+    "critical thinking", "time management", "adaptability", "creativity",
+    "collaboration", "organization", "interpersonal", "presentation",
+    "writing", "analytical", "detail oriented", "multitasking", "proactive"
+)
+
+# Only whether any of these occur matters. "\d+ year" also covers "3+ years"
+# and the "5 years" in "3-5 years", so those need no patterns of their own;
+# separate searches beat one alternation, which loses each literal prefix
+EXPERIENCE_PATTERNS = (
+    r'\d+\+?\s+year',
+    r'minimum\s+of\s+\d+',
+    r'at\s+least\s+\d+'
+)
+
+EDUCATION_KEYWORDS = (
+    "bachelor", "master", "phd", "degree", "bs", "ms", "ba", "ma",
+    "computer science", "engineering", "business", "mba"
+)
+
+CERTIFICATION_PATTERNS = (
+    r'certification',
+    r'certified',
+    r'certificate',
+    r'license'
+)
+
 class JobKeywordExtractorInput(BaseModel):
     """Input schema for JobKeywordExtractorTool."""
     job_description: str = Field(..., description="Job description text to analyze")
@@ -20,7 +57,7 @@ class JobKeywordExtractorTool(BaseTool):
     args_schema: Type[BaseModel] = JobKeywordExtractorInput
 
     # Common words to exclude from keyword analysis
-    COMMON_WORDS = {
+    COMMON_WORDS = frozenset({
         "the", "and", "a", "an", "in", "on", "at", "to", "for", "with", 
         "by", "of", "is", "are", "be", "will", "have", "has", "had", "this",
         "that", "these", "those", "we", "you", "they", "it", "he", "she",
@@ -28,7 +65,7 @@ class JobKeywordExtractorTool(BaseTool):
         "its", "can", "may", "about", "who", "when", "where", "which", "what",
         "how", "why", "any", "some", "such", "time", "same", "than", "then",
         "now", "every", "each", "only", "very", "just", "should", "would"
-    }
+    })
     
     # Technical skill categories and related terms
     SKILL_CATEGORIES = {
@@ -85,27 +122,46 @@ class JobKeywordExtractorTool(BaseTool):
         """
         Extract key skills and requirements from a job description
         """
+        # Results are cached as compact JSON, which callers can't modify;
+        # parsing it back is several times cheaper than a deepcopy
+        key = (job_description, resume_text, max_keywords, include_scores)
+        with _results_lock:
+            cached = _results.get(key)
+            if cached is not None:
+                _results.move_to_end(key)
+        if cached is not None:
+            return json_io.loads(cached)
+
+        result = self._extract_keywords(job_description, resume_text, max_keywords, include_scores)
+        if result["success"]:
+            data = json_io.dumps(result, indent=False)
+            with _results_lock:
+                _results[key] = data
+                while len(_results) > MAX_CACHED_RESULTS:
+                    _results.popitem(last=False)
+        return result
+
+    def _extract_keywords(self, job_description: str, resume_text: str, max_keywords: int, include_scores: bool) -> Dict[str, Any]:
+        """Run the extraction itself, bypassing the result cache"""
         try:
             # Normalize text
             job_description = job_description.lower()
             
             # Extract different types of keywords
-            technical_skills = self._extract_technical_skills(job_description)
-            soft_skills = self._extract_soft_skills(job_description)
-            requirements = self._extract_requirements(job_description)
-            domain_keywords = self._extract_domain_keywords(job_description)
+            # Tokenized once; the term counts and domain keywords both read the tokens
+            tokens = _TOKEN_RE.findall(job_description)
+            term_counts = _count_terms(job_description, tokens)
+            technical_skills = self._extract_technical_skills(term_counts)
+            soft_skills = self._extract_soft_skills(term_counts)
+            requirements = self._extract_requirements(job_description, term_counts)
+            domain_keywords = self._extract_domain_keywords(tokens)
             
-            # Combine all keywords
-            all_keywords = {
-                **technical_skills,
-                **soft_skills,
-                **requirements,
-                **domain_keywords
-            }
+            # Combine all keywords; a keyword found by several extractors
+            # (e.g. "python" as a skill and a domain word) sums its scores
+            all_keywords = technical_skills + soft_skills + requirements + domain_keywords
             
-            # Sort keywords by score
-            sorted_keywords = sorted(all_keywords.items(), key=lambda x: x[1], reverse=True)
-            top_keywords = sorted_keywords[:max_keywords]
+            # Top keywords by score; nlargest keeps sorted() order for ties
+            top_keywords = nlargest(max_keywords, all_keywords.items(), key=itemgetter(1))
             
             # Prepare results in different formats
             categorized_keywords = {
@@ -143,119 +199,67 @@ class JobKeywordExtractorTool(BaseTool):
                 "error": f"Failed to extract keywords: {str(e)}"
             }
     
-    def _extract_technical_skills(self, text: str) -> Dict[str, int]:
-        """Extract technical skills from job description"""
-        skills = {}
+    def _extract_technical_skills(self, term_counts: Counter) -> Counter:
+        """Extract technical skills from job description term counts"""
+        skills = Counter()
         
         # Check for skills in each category
         for category, category_skills in self.SKILL_CATEGORIES.items():
             for skill in category_skills:
-                # Look for the skill as a standalone word
-                pattern = r'\b{}\b'.format(skill)
-                matches = re.findall(pattern, text)
-                if matches:
+                count = term_counts[("skill", skill)]
+                if count:
                     # Higher score for technical skills
-                    skills[skill] = len(matches) * 2
+                    skills[skill] = count * 2
         
         # Check for synonyms
         for synonym, canonical in self.SKILL_SYNONYMS.items():
-            pattern = r'\b{}\b'.format(synonym)
-            matches = re.findall(pattern, text)
-            if matches and canonical in skills:
-                skills[canonical] += len(matches) * 2
-            elif matches:
-                skills[canonical] = len(matches) * 2
+            count = term_counts[("synonym", synonym)]
+            if count:
+                skills[canonical] += count * 2
                 
         return skills
     
-    def _extract_soft_skills(self, text: str) -> Dict[str, int]:
-        """Extract soft skills from job description"""
-        soft_skills = [
-            "communication", "teamwork", "leadership", "problem solving", 
-            "critical thinking", "time management", "adaptability", "creativity",
-            "collaboration", "organization", "interpersonal", "presentation",
-            "writing", "analytical", "detail oriented", "multitasking", "proactive"
-        ]
-        
-        skills = {}
-        for skill in soft_skills:
-            pattern = r'\b{}\b'.format(skill)
-            matches = re.findall(pattern, text)
-            if matches:
-                skills[skill] = len(matches)
+    def _extract_soft_skills(self, term_counts: Counter) -> Counter:
+        """Extract soft skills from job description term counts"""
+        skills = Counter()
+        for skill in SOFT_SKILLS:
+            count = term_counts[("soft_skill", skill)]
+            if count:
+                skills[skill] = count
                 
         return skills
     
-    def _extract_requirements(self, text: str) -> Dict[str, int]:
+    def _extract_requirements(self, text: str, term_counts: Counter) -> Counter:
         """Extract requirement patterns from job description"""
-        requirements = {}
+        requirements = Counter()
         
-        # Experience patterns
-        experience_patterns = [
-            r'(\d+)[\+]?\s+years',
-            r'(\d+)[\+]?\s+year',
-            r'(\d+)-(\d+)\s+years',
-            r'minimum\s+of\s+(\d+)',
-            r'at\s+least\s+(\d+)'
-        ]
-        
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    # Range like "3-5 years"
-                    requirements["experience"] = 3  # High importance
-                else:
-                    # Single value like "3+ years"
-                    requirements["experience"] = 3
+        # Experience patterns, e.g. "3+ years" or "3-5 years"; the first match is enough
+        if any(pattern.search(text) for pattern in _EXPERIENCE_PATTERNS):
+            requirements["experience"] = 3  # High importance
         
         # Education patterns
-        education_keywords = [
-            "bachelor", "master", "phd", "degree", "bs", "ms", "ba", "ma",
-            "computer science", "engineering", "business", "mba"
-        ]
-        
-        for keyword in education_keywords:
-            pattern = r'\b{}\b'.format(keyword)
-            matches = re.findall(pattern, text)
-            if matches:
-                if "education" in requirements:
-                    requirements["education"] += len(matches)
-                else:
-                    requirements["education"] = len(matches)
+        for keyword in EDUCATION_KEYWORDS:
+            count = term_counts[("education", keyword)]
+            if count:
+                requirements["education"] += count
         
         # Certification patterns
-        cert_patterns = [
-            r'certification',
-            r'certified',
-            r'certificate',
-            r'license'
-        ]
-        
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                if "certification" in requirements:
-                    requirements["certification"] += len(matches)
-                else:
-                    requirements["certification"] = len(matches)
+        for pattern in CERTIFICATION_PATTERNS:
+            count = term_counts[("certification", pattern)]
+            if count:
+                requirements["certification"] += count
                     
         return requirements
     
-    def _extract_domain_keywords(self, text: str) -> Dict[str, int]:
-        """Extract domain-specific keywords"""
-        # Clean and tokenize text
-        text = re.sub(r'[^\w\s]', ' ', text)
-        words = text.split()
-        
-        # Filter out common words and short words
-        filtered_words = [word for word in words if word not in self.COMMON_WORDS and len(word) > 3]
-        
-        # Count word frequency
-        word_counts = Counter(filtered_words)
+    def _extract_domain_keywords(self, tokens: List[str]) -> Counter:
+        """Extract domain-specific keywords from the job description's tokens"""
+        # Other tokens are single characters, so the length check keeps only
+        # words of four or more characters; then filter out common words
+        common_words = self.COMMON_WORDS  # looked up once, not per token
+        word_counts = Counter(token for token in tokens if len(token) > 3 and token not in common_words)
         
         # Keep only words that appear at least twice
-        domain_keywords = {word: count for word, count in word_counts.items() if count >= 2}
+        domain_keywords = Counter({word: count for word, count in word_counts.items() if count >= 2})
         
         return domain_keywords
     
@@ -267,18 +271,25 @@ class JobKeywordExtractorTool(BaseTool):
         total_score = 0
         max_score = 0
         
+        # A keyword made only of word characters matches as a standalone word
+        # exactly when it is one of the resume's tokens; the resume is tokenized
+        # once and only multi-word or punctuated keywords need a regex search
+        resume_tokens = set(_TOKEN_RE.findall(resume_text))
         for keyword, score in job_keywords.items():
             max_score += score
-            if re.search(r'\b{}\b'.format(keyword), resume_text):
+            if _WORD_RE.fullmatch(keyword):
+                present = keyword in resume_tokens
+            else:
+                present = (_KEYWORD_PATTERNS.get(keyword) or _word_pattern(keyword)).search(resume_text)
+            if present:
                 present_keywords.append(keyword)
                 total_score += score
             else:
                 missing_keywords.append(keyword)
         
-        # Sort missing keywords by importance (score)
+        # Missing keywords by importance (score)
         missing_keywords_with_scores = [(k, job_keywords[k]) for k in missing_keywords]
-        sorted_missing = sorted(missing_keywords_with_scores, key=lambda x: x[1], reverse=True)
-        important_missing = [k for k, _ in sorted_missing[:10]]  # Top 10 missing keywords
+        important_missing = [k for k, _ in nlargest(10, missing_keywords_with_scores, key=itemgetter(1))]  # Top 10 missing keywords
         
         # Calculate match percentage
         match_percentage = (total_score / max_score * 100) if max_score > 0 else 0
@@ -289,4 +300,93 @@ class JobKeywordExtractorTool(BaseTool):
             "missing_keywords": important_missing,
             "total_keywords": len(job_keywords),
             "total_matches": len(present_keywords)
-        } 
\ No newline at end of file
+        } 
+
+def _word_pattern(term: str):
+    """Compile term to match only as a standalone word"""
+    return re.compile(r'\b{}\b'.format(term))
+
+# (group, term) -> pattern, compiled once at import rather than re-parsed for
+# every term on every call. Certification patterns are plain substrings.
+_TERM_PATTERNS = {
+    **{
+        ("skill", skill): _word_pattern(skill)
+        for category_skills in JobKeywordExtractorTool.SKILL_CATEGORIES.values()
+        for skill in category_skills
+    },
+    **{("synonym", synonym): _word_pattern(synonym) for synonym in JobKeywordExtractorTool.SKILL_SYNONYMS},
+    **{("soft_skill", skill): _word_pattern(skill) for skill in SOFT_SKILLS},
+    **{("education", keyword): _word_pattern(keyword) for keyword in EDUCATION_KEYWORDS},
+    **{("certification", pattern): re.compile(pattern) for pattern in CERTIFICATION_PATTERNS},
+}
+_UNBOUNDED_GROUPS = {"certification"}
+_EXPERIENCE_PATTERNS = tuple(re.compile(pattern) for pattern in EXPERIENCE_PATTERNS)
+# Job keywords looked up in the resume; anything else (domain words) is compiled on demand
+_KEYWORD_PATTERNS = {term: pattern for (group, term), pattern in _TERM_PATTERNS.items() if group in ("skill", "soft_skill")}
+
+# A regex operator that isn't backslash-escaped, e.g. the '.' in "react.js"
+_REGEX_OPERATOR = re.compile(r'(?<!\\)[.^$*+?{}\[\]|()]')
+# Runs of word characters and single other characters: token edges fall
+# exactly where \b can, so whole-token matches are standalone-word matches
+_TOKEN_RE = re.compile(r'\w+|\W')
+_WORD_RE = re.compile(r'\w+')
+
+def _build_term_trie():
+    """Build a token trie over every standalone-word term that is plain text once unescaped
+
+    Terminal nodes hold the (group, term) keys ending there under None. Returns
+    the trie and the keys it covers; other terms keep their compiled pattern.
+    """
+    trie = {}
+    covered = set()
+    for key in _TERM_PATTERNS:
+        group, term = key
+        if group in _UNBOUNDED_GROUPS or _REGEX_OPERATOR.search(term):
+            continue
+        node = trie
+        for token in _TOKEN_RE.findall(re.sub(r'\\(.)', r'\1', term)):
+            node = node.setdefault(token, {})
+        node.setdefault(None, []).append(key)
+        covered.add(key)
+    return trie, frozenset(covered)
+
+_TERM_TRIE, _TRIE_KEYS = _build_term_trie()
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+def _count_terms(text: str, tokens: List[str]) -> Counter:
+    """Count occurrences of every term in text, keyed by (group, term)
+
+    tokens is _TOKEN_RE.findall(text). Counts are what pattern.findall would
+    give; trie terms are found in one walk over the tokens instead of one
+    regex scan per term.
+    """
+    counts = Counter()
+    next_start = {}
+    for start in range(len(tokens)):
+        node = _TERM_TRIE.get(tokens[start])
+        end = start
+        while node is not None:
+            if None in node:
+                # Whole tokens only leave \b to check where a term begins or
+                # ends with a non-word character, e.g. after the "++" in "c++"
+                bounded = (
+                    (_is_word_char(tokens[start][0]) or (start > 0 and _is_word_char(tokens[start - 1][0])))
+                    and (_is_word_char(tokens[end][0]) or (end + 1 < len(tokens) and _is_word_char(tokens[end + 1][0])))
+                )
+                for key in node[None]:
+                    if bounded and start >= next_start.get(key, 0):
+                        counts[key] += 1
+                        next_start[key] = end + 1
+            end += 1
+            node = node.get(tokens[end]) if end < len(tokens) else None
+
+    # Left as one scan per term: in Python's re an alternation of these is
+    # slower, since it loses the literal-prefix search each pattern gets alone
+    for key, pattern in _TERM_PATTERNS.items():
+        if key not in _TRIE_KEYS:
+            count = len(pattern.findall(text))
+            if count:
+                counts[key] = count
+    return counts
@@ -1,14 +1,38 @@
 import os
+import re
 import logging
+import shutil
+import functools
+import contextvars
 import subprocess
 from pathlib import Path
 from typing import Any
 from crewai.tools import BaseTool
 
-# Setup logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# latexmk runs only as many pdflatex passes as the document needs
+LATEXMK_AVAILABLE = shutil.which('latexmk') is not None
+
+# File name, without suffix, of the .tex/.pdf written when no output path is
+# given. Batch runs set one per candidate so that concurrent candidates don't
+# overwrite or compile each other's files; the value follows the crew's kickoff
+# into its worker thread with the rest of the context.
+OUTPUT_STEM = contextvars.ContextVar("latex_output_stem", default="resume")
+
+# {{{name}}} placeholders in resume templates
+_PLACEHOLDER_RE = re.compile(r'\{\{\{(\w+)\}\}\}')
+
+@functools.lru_cache(maxsize=16)
+def _read_template(path, mtime_ns, size):
+    with open(path, 'r') as f:
+        return f.read()
+
+def _load_template(path):
+    """Return a template's text, reading the file again only after it changes"""
+    stat = os.stat(path)
+    return _read_template(str(path), stat.st_mtime_ns, stat.st_size)
+
 class LaTeXGeneratorTool(BaseTool):
     name: str = "LaTeX Generator Tool"
     description: str = "Generates and compiles ATS-friendly LaTeX resumes into PDF format"
@@ -64,19 +88,23 @@ class LaTeXGeneratorTool(BaseTool):
         if not template_path:
             template_path = self.latex_template_path
         if not output_path:
-            output_path = self.base_dir / "output" / "resume.tex"
+            output_path = self.base_dir / "output" / f"{OUTPUT_STEM.get()}.tex"
         
         output_dir = Path(output_path).parent
         if not output_dir.exists():
             output_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(template_path, 'r') as f:
-            template_content = f.read()
+        template_content = _load_template(template_path)
         
         try:
-            for key, value in template_variables.items():
-                placeholder = '{{{' + key + '}}}'
-                template_content = template_content.replace(placeholder, str(value or ''))
+            def substitute(match):
+                key = match.group(1)
+                if key not in template_variables:
+                    return match.group(0)  # leave placeholders without a value as they are
+                return str(template_variables[key] or '')
+
+            # One pass over the template; substituted values aren't scanned again
+            template_content = _PLACEHOLDER_RE.sub(substitute, template_content)
             
             with open(output_path, 'w') as f:
                 f.write(template_content)
@@ -88,6 +116,8 @@ class LaTeXGeneratorTool(BaseTool):
             raise
     
     def _compile_to_pdf(self, latex_path, output_dir=None):
+        if not latex_path:
+            latex_path = self.base_dir / "output" / f"{OUTPUT_STEM.get()}.tex"
         latex_path = Path(latex_path)
         if not output_dir:
             output_dir = latex_path.parent
@@ -98,20 +128,23 @@ class LaTeXGeneratorTool(BaseTool):
         
         try:
             logger.info(f"Compiling LaTeX file {latex_path} to PDF")
-            original_dir = os.getcwd()
-            os.chdir(latex_path.parent)
+            if LATEXMK_AVAILABLE:
+                commands = [['latexmk', '-pdf', '-interaction=nonstopmode', '-halt-on-error', latex_path.name]]
+            else:
+                commands = [['pdflatex', '-interaction=nonstopmode', latex_path.name]] * 2
             
-            for _ in range(2):
+            # cwd= instead of os.chdir, so concurrent compiles don't share a working directory
+            for command in commands:
                 result = subprocess.run(
-                    ['pdflatex', '-interaction=nonstopmode', latex_path.name],
+                    command,
+                    cwd=str(latex_path.parent),
                     capture_output=True, 
                     text=True
                 )
                 if result.returncode != 0:
-                    logger.error(f"pdflatex error: {result.stderr}")
+                    logger.error(f"{command[0]} error: {result.stderr}")
                     raise Exception(f"Failed to compile LaTeX: {result.stderr}")
             
-            os.chdir(original_dir)
             pdf_path = latex_path.with_suffix('.pdf')
             if not pdf_path.exists():
                 raise FileNotFoundError(f"PDF file not found at expected path: {pdf_path}")
@@ -8,7 +8,7 @@ from typing import Type, Dict, Any, Optional, List
 from pathlib import Path
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from dotenv import load_dotenv
+from resumemaker.utils.env import load_env
 
 logger = logging.getLogger(__name__)
 
@@ -140,7 +140,7 @@ class LinkedInExtractorTool(BaseTool):
         """Login to LinkedIn with credentials from environment variables"""
         try:
             # Load environment variables
-            load_dotenv()
+            load_env()
             
             email = os.environ.get('LINKEDIN_EMAIL')
             password = os.environ.get('LINKEDIN_PASSWORD')
@@ -1,16 +1,15 @@
 from typing import Type, Dict, Any
 import os
 import logging
+import functools
 import requests
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
-from dotenv import load_dotenv
+from resumemaker.utils.env import load_env
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-load_dotenv()
+load_env()
 
 # Try to import Mistral, but provide graceful fallback if not available
 MISTRAL_AVAILABLE = False
@@ -21,6 +20,11 @@ except ImportError:
     logger.warning("mistralai package not found. MistralPDFUploadTool will be available but non-functional.")
     logger.warning("Install with: pip install mistralai")
 
+@functools.lru_cache(maxsize=None)
+def _client(api_key):
+    """One Mistral client per API key, so uploads reuse its HTTP connections"""
+    return Mistral(api_key=api_key)
+
 class PDFUploadInput(BaseModel):
     """Input schema for MistralPDFUploadTool."""
     file_path: str = Field(..., description="Path to the PDF file to upload.")
@@ -48,8 +52,10 @@ class MistralPDFUploadTool(BaseTool):
             return {"error": f"File '{file_path}' not found."}
 
         try:
-            client = Mistral(api_key=API_KEY)
+            client = _client(API_KEY)
 
+            # The open file is handed to httpx's multipart encoder, which reads
+            # it in chunks, so large PDFs are streamed rather than loaded whole
             with open(file_path, "rb") as file:
                 uploaded_pdf = client.files.upload(
                     file={"file_name": os.path.basename(file_path), "content": file},
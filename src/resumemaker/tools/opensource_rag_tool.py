@@ -1,18 +1,148 @@
 from typing import Type, Dict, Any
 import os
+import hashlib
+import logging
+import functools
+import threading
+import uuid
+from collections import OrderedDict
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
-from dotenv import load_dotenv
-from langchain_community.document_loaders import TextLoader
-from langchain_community.vectorstores import FAISS
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.chains.combine_documents import create_stuff_documents_chain
-from langchain_core.prompts import ChatPromptTemplate
-from langchain.chains import create_retrieval_chain
-from langchain_community.llms import HuggingFaceEndpoint
-
-load_dotenv()
+from resumemaker.utils.env import load_env
+from resumemaker.utils.paths import CACHE_ROOT
+
+# LangChain, FAISS and sentence-transformers are imported inside the functions
+# that use them: together they take seconds to import, and most runs that load
+# this module (CLI commands, crew construction) never query the tool
+
+load_env()
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# The model runs locally and encodes every chunk in one call, in batches of this size
+EMBED_BATCH_SIZE = 64
+# Part of the index key. No overlap: it adds chunks to embed without improving retrieval
+SPLITTER_CONFIG = {"chunk_size": 4000, "chunk_overlap": 0}
+# Built indexes are saved here so later runs over the same file skip embedding
+CACHE_DIR = CACHE_ROOT / "rag"
+MAX_CACHED_INDEXES = 8  # most recently used indexes kept in memory
+# Below this many chunks a flat (exact) index is as fast as HNSW and needs no graph
+HNSW_MIN_CHUNKS = 10_000
+HNSW_M = 32
+HNSW_EF_SEARCH = 64
+# With RESUMEMAKER_RAG_PQ, large corpora use IVF-PQ instead of HNSW, storing
+# 48 bytes per vector rather than 1536 (384 float32 dims) at some cost in recall
+PQ_NLIST = 128
+PQ_SUBVECTORS = 48  # must divide the embedding dimension
+PQ_BITS = 8
+PQ_NPROBE = 16
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+_embeddings_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _load_embeddings(hf_token):
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    return HuggingFaceEmbeddings(
+        model_name=EMBEDDING_MODEL,
+        huggingfacehub_api_token=hf_token,
+        encode_kwargs={"batch_size": EMBED_BATCH_SIZE},
+    )
+
+def _embeddings(hf_token):
+    """Load the sentence-transformers model once per process
+
+    The lock keeps a warm-up thread and the tool from loading it twice.
+    """
+    with _embeddings_lock:
+        return _load_embeddings(hf_token)
+
+def warm_up():
+    """Load the embedding model ahead of the first query, if a token is set"""
+    hf_token = os.getenv("HUGGING_FACE_TOKEN")
+    if hf_token:
+        _embeddings(hf_token)
+
+def pq_enabled() -> bool:
+    """Whether large indexes should be product-quantized to save memory"""
+    return os.getenv("RESUMEMAKER_RAG_PQ", "").lower() in ("1", "true", "yes")
+
+def _index_key(file_path) -> str:
+    """Hash the file's identity plus everything that shapes its index"""
+    stat = os.stat(file_path)
+    digest = hashlib.sha256()
+    for part in (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, EMBEDDING_MODEL, sorted(SPLITTER_CONFIG.items()), pq_enabled()):
+        digest.update(repr(part).encode("utf-8"))
+    return digest.hexdigest()
+
+def _build_vector_store(documents, embeddings):
+    """Index documents, switching from exact search to HNSW or IVF-PQ for large corpora"""
+    import faiss
+    import numpy as np
+    from langchain_community.vectorstores import FAISS
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+
+    if len(documents) < HNSW_MIN_CHUNKS:
+        return FAISS.from_documents(documents, embeddings)
+
+    vectors = np.asarray(embeddings.embed_documents([doc.page_content for doc in documents]), dtype="float32")
+    dimension = vectors.shape[1]
+    if pq_enabled():
+        index = faiss.IndexIVFPQ(faiss.IndexFlatL2(dimension), dimension, PQ_NLIST, PQ_SUBVECTORS, PQ_BITS)
+        index.train(vectors)
+        index.nprobe = PQ_NPROBE
+    else:
+        index = faiss.IndexHNSWFlat(dimension, HNSW_M)
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+    index.add(vectors)
+    ids = [str(uuid.uuid4()) for _ in documents]
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore(dict(zip(ids, documents))),
+        index_to_docstore_id=dict(enumerate(ids)),
+    )
+
+def _load_vector_store(file_path, embeddings):
+    """Return the FAISS store for file_path from memory, disk, or a fresh build"""
+    from langchain_community.document_loaders import TextLoader
+    from langchain_community.vectorstores import FAISS
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    key = _index_key(file_path)
+    with _indexes_lock:
+        if key in _indexes:
+            _indexes.move_to_end(key)
+            return _indexes[key]
+
+    index_dir = CACHE_DIR / key
+    vector = None
+    if index_dir.exists():
+        try:
+            # The index was written by this tool, so unpickling its docstore is safe
+            vector = FAISS.load_local(str(index_dir), embeddings, allow_dangerous_deserialization=True)
+        except Exception as e:
+            logger.warning(f"Rebuilding unreadable FAISS index {key}: {str(e)}")
+
+    if vector is None:
+        docs = TextLoader(file_path).load()
+        documents = RecursiveCharacterTextSplitter(**SPLITTER_CONFIG).split_documents(docs)
+        vector = _build_vector_store(documents, embeddings)
+        try:
+            vector.save_local(str(index_dir))
+        except OSError as e:
+            logger.warning(f"Could not save FAISS index: {str(e)}")
+
+    with _indexes_lock:
+        _indexes[key] = vector
+        _indexes.move_to_end(key)
+        while len(_indexes) > MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+    return vector
 
 class OpenSourceRAGInput(BaseModel):
     """Input schema for OpenSourceRAGTool."""
@@ -36,22 +166,16 @@ class OpenSourceRAGTool(BaseTool):
             return {"error": f"File '{file_path}' not found."}
 
         try:
-            # Load data from the text file
-            loader = TextLoader(file_path)
-            docs = loader.load()
-
-            # Split text into chunks
-            text_splitter = RecursiveCharacterTextSplitter()
-            documents = text_splitter.split_documents(docs)
+            from langchain.chains.combine_documents import create_stuff_documents_chain
+            from langchain_core.prompts import ChatPromptTemplate
+            from langchain.chains import create_retrieval_chain
+            from langchain_community.llms import HuggingFaceEndpoint
 
             # Define the embedding model - uses HuggingFace instead of Mistral
-            embeddings = HuggingFaceEmbeddings(
-                model_name="sentence-transformers/all-MiniLM-L6-v2", 
-                huggingfacehub_api_token=HF_TOKEN
-            )
+            embeddings = _embeddings(HF_TOKEN)
 
-            # Create the vector store
-            vector = FAISS.from_documents(documents, embeddings)
+            # Load, split and embed the file, reusing a saved index when it hasn't changed
+            vector = _load_vector_store(file_path, embeddings)
 
             # Define a retriever interface
             retriever = vector.as_retriever()
@@ -1,18 +1,120 @@
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Type
 from crewai.tools import BaseTool
-from langchain_community.document_loaders import PyPDFLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from resumemaker.utils.pdf_pages import extract_page_range
+
+# Prefer the fastest available extraction backend: PyMuPDF, then pypdfium2,
+# then the LangChain PyPDFLoader pipeline.
+FITZ_AVAILABLE = False
+try:
+    import fitz
+    FITZ_AVAILABLE = True
+except ImportError:
+    pass
+
+PDFIUM_AVAILABLE = False
+try:
+    import pypdfium2
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    pass
+
+# Below this many pages per worker, splitting a document costs more than it saves
+PARALLEL_MIN_PAGES = 32
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+def _get_page_pool():
+    """Return the process-wide page extraction pool, starting it on first use
+
+    Workers are spawned, not forked: the tool runs in CrewAI and asyncio
+    worker threads, and forking a threaded process can deadlock on a lock
+    another thread held. Spawned workers are slow to start, so the pool is
+    kept for later documents instead of being started for each one.
+    """
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context("spawn"))
+        return _page_pool
+
+def _discard_page_pool(pool):
+    """Drop a broken pool so the next document starts a fresh one"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+    pool.shutdown(wait=False)
 
 class PDFAnalyzerTool(BaseTool):
-    name: str = "PDFAnalyzer" 
-    description: str = "Extracts and processes text from scientific PDF papers."  
+    name: str = "PDFAnalyzer"
+    description: str = "Extracts and processes text from scientific PDF papers."
 
     def _run(self, pdf_path: str) -> str:
         try:
-            loader = PyPDFLoader(pdf_path)
-            documents = loader.load()
-            text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-            docs = text_splitter.split_documents(documents)
-            return "\n\n".join([doc.page_content for doc in docs])
+            if FITZ_AVAILABLE:
+                return "\n".join(self._extract_with_fitz(str(pdf_path)))
+            return "\n".join(self.iter_pages(pdf_path))
         except Exception as e:
-            return f"Error processing PDF: {str(e)}" 
\ No newline at end of file
+            return f"Error processing PDF: {str(e)}"
+
+    def iter_pages(self, pdf_path):
+        """Yield the text of each page in turn, keeping only one page in memory
+
+        Callers that stop early (e.g. once they have enough context for a
+        prompt) never extract the remaining pages.
+        """
+        if FITZ_AVAILABLE:
+            return self._iter_with_fitz(str(pdf_path))
+        if PDFIUM_AVAILABLE:
+            return self._iter_with_pdfium(str(pdf_path))
+        return self._iter_with_langchain(str(pdf_path))
+
+    def _extract_with_fitz(self, pdf_path: str):
+        """Extract every page, splitting large documents across processes"""
+        with fitz.open(pdf_path) as doc:
+            page_count = doc.page_count
+        workers = min(os.cpu_count() or 1, page_count // PARALLEL_MIN_PAGES)
+        if workers < 2:
+            return list(self._iter_with_fitz(pdf_path))
+
+        # One contiguous range per worker, so each opens the file only once
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        pool = _get_page_pool()
+        try:
+            ranges = list(pool.map(extract_page_range, [pdf_path] * workers, bounds[:-1], bounds[1:]))
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for using too much memory), which
+            # leaves the pool unusable
+            _discard_page_pool(pool)
+            return list(self._iter_with_fitz(pdf_path))
+        return [text for page_texts in ranges for text in page_texts]
+
+    def _iter_with_fitz(self, pdf_path: str):
+        doc = fitz.open(pdf_path)
+        try:
+            for page in doc:
+                yield page.get_text("text")
+        finally:
+            doc.close()
+
+    def _iter_with_pdfium(self, pdf_path: str):
+        pdf = pypdfium2.PdfDocument(pdf_path)
+        try:
+            for page in pdf:
+                yield page.get_textpage().get_text_range()
+        finally:
+            pdf.close()
+
+    def _iter_with_langchain(self, pdf_path: str):
+        from langchain_community.document_loaders import PyPDFLoader
+
+        # Pages are yielded whole: splitting them into chunks only to join the
+        # chunks straight back together cost time without changing the text
+        for document in PyPDFLoader(pdf_path).lazy_load():
+            yield document.page_content
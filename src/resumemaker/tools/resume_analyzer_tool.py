@@ -5,7 +5,7 @@ from typing import Type, Dict, Any, List
 from pathlib import Path
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from resumemaker.tools.custom_tool import PDFAnalyzerTool
+from resumemaker.tools.pdf_analyzer_tool import PDFAnalyzerTool
 
 logger = logging.getLogger(__name__)
 
@@ -2,14 +2,14 @@ import os
 import sys
 import logging
 from pathlib import Path
-from dotenv import load_dotenv
+from resumemaker.utils.env import load_env
 
 logger = logging.getLogger(__name__)
 
 def check_api_keys():
     """Check if necessary API keys are present"""
     # Load environment variables
-    load_dotenv()
+    load_env()
     
     # Check for OpenRouter API key
     openrouter_api_key = os.getenv('OPENROUTER_API_KEY')
@@ -0,0 +1,40 @@
+import threading
+import contextlib
+
+class CrewPool:
+    """Build a crew once and hand out a fresh copy of it for every kickoff
+
+    A Crew keeps per-run state: task outputs, agent state and its tool-result
+    cache. Reusing one object would carry that state, including another
+    candidate's cached tool results, into the next run. Each kickoff gets
+    crew.copy() instead, the same way Crew.kickoff_for_each isolates its
+    inputs, while the YAML configs, LLM and tools behind the template stay
+    shared.
+
+    The template's RPM limiter is shared too. Crew.copy() would give every
+    copy its own, so n concurrent runs could send n times max_rpm requests
+    to the provider.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._template = None
+        self._lock = threading.Lock()
+
+    def _get_template(self):
+        with self._lock:
+            if self._template is None:
+                self._template = self._factory()
+            return self._template
+
+    def invalidate(self):
+        """Drop the template so the next kickoff builds one from the current config"""
+        with self._lock:
+            self._template = None
+
+    @contextlib.contextmanager
+    def crew(self):
+        template = self._get_template()
+        crew = template.copy()
+        crew._rpm_controller = template._rpm_controller
+        yield crew
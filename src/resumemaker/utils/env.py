@@ -0,0 +1,11 @@
+import functools
+
+@functools.lru_cache(maxsize=None)
+def load_env():
+    """Load variables from .env into the environment (runs once per process)
+
+    load_dotenv walks up the directory tree looking for the file, so modules
+    call this instead of load_dotenv() directly.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
@@ -0,0 +1,48 @@
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+
+from resumemaker.utils import json_io
+from resumemaker.utils.paths import CACHE_ROOT
+
+logger = logging.getLogger(__name__)
+
+# Candidate profiles from earlier extraction runs, keyed on a hash of the inputs
+CACHE_DIR = CACHE_ROOT / "extraction"
+
+# Profiles include LinkedIn and GitHub data, so they expire with the GitHub
+# cache rather than living until the resume or job posting changes
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+def extraction_key(resume_path, job_posting_path, config) -> str:
+    """Hash the resume, job posting and config that the extraction crew sees"""
+    digest = hashlib.sha256()
+    digest.update(Path(resume_path).read_bytes())
+    digest.update(Path(job_posting_path).read_bytes())
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+def get_cached_profile(key):
+    """Return the profile stored for key, or None if there isn't a fresh one"""
+    cache_file = CACHE_DIR / f"{key}.json"
+    if not cache_file.exists():
+        cache_file = cache_file.with_name(cache_file.name + ".zst")
+    try:
+        if time.time() - cache_file.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+        return json_io.load_profile(cache_file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cached profile for {key}: {str(e)}")
+        return None
+
+def cache_profile(key, profile):
+    """Store an extracted profile so identical inputs can skip the extraction crew"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        json_io.dump_profile(profile, CACHE_DIR / f"{key}.json", compress=True)
+    except OSError as e:
+        logger.warning(f"Could not cache extracted profile: {str(e)}")
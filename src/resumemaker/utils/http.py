@@ -0,0 +1,59 @@
+import functools
+import importlib.util
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizes shared by the tool and LLM HTTP clients
+POOL_SIZE = 32
+MAX_CONNECTIONS = 80
+KEEPALIVE_SECONDS = 90
+
+# Default timeout (seconds) for tool requests, and retries for transient failures
+REQUEST_TIMEOUT = 10
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+@functools.lru_cache(maxsize=None)
+def get_session():
+    """Return the process-wide requests.Session used by the tools
+
+    Reusing one session keeps TCP/TLS connections alive between calls.
+    Idempotent requests that hit a rate limit or a 5xx are retried with
+    exponential backoff.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUSES, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@functools.lru_cache(maxsize=None)
+def configure_litellm_pool():
+    """Point litellm at a shared keep-alive httpx client (runs once)
+
+    Every LLM in the process then reuses the same connections instead of
+    paying a TLS handshake per request. HTTP/2 is used when h2 is installed.
+    Only the sync client is shared: an httpx.AsyncClient's pooled connections
+    belong to the event loop that opened them, and the pipeline calls
+    asyncio.run more than once. The crews' kickoff_async runs the sync
+    kickoff in a worker thread, so their LLM calls use this client too.
+    """
+    try:
+        import httpx
+        import litellm
+    except ImportError as e:
+        logger.warning(f"Could not configure LLM connection pool: {str(e)}")
+        return
+
+    limits = httpx.Limits(
+        max_keepalive_connections=POOL_SIZE,
+        max_connections=MAX_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_SECONDS
+    )
+    http2 = importlib.util.find_spec("h2") is not None
+    litellm.client_session = httpx.Client(limits=limits, timeout=600, http2=http2)
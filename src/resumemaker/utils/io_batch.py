@@ -0,0 +1,76 @@
+import os
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+class BatchWriter:
+    """Collect file writes and flush them together when the block exits
+
+    Chunks added for the same path are written with a single os.writev call
+    where the platform supports it. Queued removals happen only after every
+    write has succeeded. Nothing is written if the block raises.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._removals = set()
+
+    def add(self, path, data: bytes):
+        """Queue data to be written to path, cancelling a queued removal of it"""
+        path = Path(path)
+        self._removals.discard(path)
+        self._pending.setdefault(path, []).append(memoryview(data))
+
+    def unlink(self, path):
+        """Queue path for removal once the queued writes are on disk
+
+        Any writes already queued for path are dropped.
+        """
+        path = Path(path)
+        self._pending.pop(path, None)
+        self._removals.add(path)
+
+    def flush(self):
+        """Write all queued files, then make the queued removals, and clear the queue"""
+        try:
+            for path, chunks in self._pending.items():
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    self._write_all(fd, chunks)
+                finally:
+                    os.close(fd)
+                logger.debug(f"Wrote {sum(len(c) for c in chunks)} bytes to {path}")
+            for path in self._removals:
+                path.unlink(missing_ok=True)
+        finally:
+            self._pending.clear()
+            self._removals.clear()
+
+    @staticmethod
+    def _write_all(fd, chunks):
+        if not hasattr(os, "writev"):
+            for chunk in chunks:
+                while chunk:
+                    chunk = chunk[os.write(fd, chunk):]
+            return
+
+        while chunks:
+            written = os.writev(fd, chunks)
+            # Drop fully written chunks and trim a partially written one
+            while chunks and written >= len(chunks[0]):
+                written -= len(chunks[0])
+                chunks = chunks[1:]
+            if chunks and written:
+                chunks = [chunks[0][written:]] + chunks[1:]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._pending.clear()
+            self._removals.clear()
+        return False
@@ -0,0 +1,87 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib."""
+
+import json
+from pathlib import Path
+
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+ZSTD_AVAILABLE = False
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    pass
+
+# Raised by loads for malformed input; orjson's error subclasses this one
+JSONDecodeError = json.JSONDecodeError
+
+# With compress=True, profiles larger than this are written zstd-compressed
+# as <name>.zst
+COMPRESS_THRESHOLD = 50 * 1024
+
+def dumps(obj, indent: bool = True) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, pretty-printed with two-space indent by default"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_profile(obj, path, writer=None, compress=False) -> Path:
+    """Write obj as JSON to path
+
+    With compress=True, meant for internal cache files, a large profile goes
+    to <path>.zst instead. Without it the file is written exactly at path.
+    If writer (a BatchWriter) is given the write is queued on it instead of
+    happening immediately. Returns the path written.
+    """
+    path = Path(path)
+    data = dumps(obj)
+    if not compress:
+        if writer is not None:
+            writer.add(path, data)
+        else:
+            path.write_bytes(data)
+        return path
+
+    compressed_path = path.with_name(path.name + ".zst")
+    if ZSTD_AVAILABLE and len(data) > COMPRESS_THRESHOLD:
+        data = zstandard.ZstdCompressor(level=3).compress(data)
+        target, stale = compressed_path, path
+    else:
+        target, stale = path, compressed_path
+
+    # Don't leave an older copy in the other format behind, but only remove
+    # it once the new file is written so a failure never loses both
+    if writer is not None:
+        writer.add(target, data)
+        writer.unlink(stale)
+    else:
+        target.write_bytes(data)
+        stale.unlink(missing_ok=True)
+    return target
+
+def load_profile(path):
+    """Load a profile written by dump_profile, handling both .json and .json.zst"""
+    path = Path(path)
+    if not path.exists() and path.suffix != ".zst":
+        path = path.with_name(path.name + ".zst")
+
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read compressed profiles. Install with: pip install zstandard")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return loads(data)
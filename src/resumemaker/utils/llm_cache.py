@@ -0,0 +1,112 @@
+import os
+import json
+import hashlib
+import logging
+
+from crewai import LLM
+
+from resumemaker.utils import json_io
+from resumemaker.utils.paths import CACHE_ROOT
+
+logger = logging.getLogger(__name__)
+
+# LLM responses are cached here, one file per distinct request
+CACHE_DIR = CACHE_ROOT / "llm"
+
+# Without RESUMEMAKER_LLM_CACHE only near-deterministic calls are cached
+MAX_CACHED_TEMPERATURE = 0.3
+
+def llm_cache_enabled() -> bool:
+    """Whether caching has been switched on for every call, whatever its temperature"""
+    return os.getenv("RESUMEMAKER_LLM_CACHE", "").lower() in ("1", "true", "yes")
+
+# Providers that reject a conversation ending on an assistant turn
+STRICT_TRAILING_ASSISTANT_MODELS = {"mistral/mistral-large-latest"}
+CONTINUE_MESSAGE = {"role": "user", "content": "Please continue."}
+
+# CrewAI agents with tools describe them in the ReAct prompt rather than
+# passing them as `tools`; the format it asks for always includes this line
+REACT_TOOL_MARKER = "Action Input:"
+
+def _offers_tools(messages) -> bool:
+    """Whether the prompt is a ReAct prompt that lets the model call tools"""
+    if isinstance(messages, str):
+        return REACT_TOOL_MARKER in messages
+    return any(REACT_TOOL_MARKER in str(m.get("content", "")) for m in messages)
+
+def _is_plain(message) -> bool:
+    return set(message) == {"role", "content"} and isinstance(message["content"], str)
+
+def _normalize(messages, model):
+    """Return messages with the system prompt first and same-role runs merged
+
+    Providers reuse cached prompt prefixes, so keeping the static agent and
+    task instructions ahead of the per-candidate content lets consecutive
+    tasks share that prefix. The input list is never modified.
+    """
+    if not isinstance(messages, list):
+        return messages
+
+    system = [m for m in messages if m.get("role") == "system"]
+    if len(system) > 1 or (system and messages[0] is not system[0]):
+        merged = {"role": "system", "content": "\n\n".join(str(m.get("content", "")) for m in system)}
+        messages = [merged] + [m for m in messages if m.get("role") != "system"]
+
+    # Merge adjacent plain messages from the same role instead of padding
+    # the conversation with filler turns
+    normalized = []
+    for message in messages:
+        previous = normalized[-1] if normalized else None
+        if previous and previous["role"] == message.get("role") and _is_plain(previous) and _is_plain(message):
+            normalized[-1] = {"role": previous["role"], "content": previous["content"] + "\n\n" + message["content"]}
+        else:
+            normalized.append(message)
+
+    if model in STRICT_TRAILING_ASSISTANT_MODELS and normalized and normalized[-1].get("role") == "assistant":
+        normalized.append(CONTINUE_MESSAGE)
+    return normalized
+
+class CachingLLM(LLM):
+    """LLM that answers repeated identical requests from an on-disk cache
+
+    Entries are keyed on the model, temperature and messages, so any change to
+    the resume, job posting or prompts is a miss. Calls that offer tools,
+    whether as `tools` or in an agent's ReAct prompt, are never cached since
+    the tools may have side effects or return fresh data. Messages are
+    normalized first (see _normalize) so provider prompt caching applies.
+    """
+
+    def _cacheable(self) -> bool:
+        if llm_cache_enabled():
+            return True
+        return self.temperature is not None and self.temperature <= MAX_CACHED_TEMPERATURE
+
+    def _cache_key(self, messages) -> str:
+        payload = json.dumps(
+            {"model": self.model, "temperature": self.temperature, "messages": messages},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        messages = _normalize(messages, self.model)
+        if tools or available_functions or _offers_tools(messages) or not self._cacheable():
+            return super().call(messages, tools=tools, callbacks=callbacks, available_functions=available_functions, **kwargs)
+
+        cache_file = CACHE_DIR / f"{self._cache_key(messages)}.json"
+        try:
+            return json_io.loads(cache_file.read_bytes())["response"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {cache_file}: {str(e)}")
+
+        response = super().call(messages, callbacks=callbacks, **kwargs)
+
+        if isinstance(response, str):
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(json_io.dumps({"response": response}, indent=False))
+            except OSError as e:
+                logger.warning(f"Could not cache LLM response: {str(e)}")
+        return response
@@ -0,0 +1,21 @@
+import os
+import logging
+
+# HTTP and LLM client libraries that log every request at INFO
+NOISY_LOGGERS = ("httpx", "httpcore", "urllib3", "litellm", "LiteLLM")
+
+def debug_enabled() -> bool:
+    """Whether RESUME_DEBUG asks for debug logging and verbose crews"""
+    return bool(os.getenv("RESUME_DEBUG"))
+
+def quiet_third_party_loggers():
+    """Raise the noisy client libraries to WARNING unless debugging"""
+    if debug_enabled():
+        return
+    for name in NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+def configure_logging():
+    """Configure root logging for an entry point; library modules never call this"""
+    logging.basicConfig(level=logging.DEBUG if debug_enabled() else logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    quiet_third_party_loggers()
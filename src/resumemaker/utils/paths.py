@@ -0,0 +1,12 @@
+import os
+from pathlib import Path
+
+# Computed once at import; os.path.abspath doesn't stat every path component
+# the way Path.resolve() does
+PACKAGE_DIR = Path(os.path.abspath(__file__)).parent.parent
+PROJECT_ROOT = PACKAGE_DIR.parent.parent  # src/resumemaker -> project root
+INPUT_DIR = PROJECT_ROOT / "input"
+OUTPUT_DIR = PROJECT_ROOT / "output"
+
+# Parent of every on-disk cache (pdf, llm, yaml, extraction, github, rag)
+CACHE_ROOT = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "resumemaker"
@@ -0,0 +1,72 @@
+import hashlib
+import functools
+import logging
+from pathlib import Path
+
+from resumemaker.utils.paths import CACHE_ROOT
+
+logger = logging.getLogger(__name__)
+
+ZSTD_AVAILABLE = False
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    pass
+
+# Text extracted from PDFs is cached here, keyed on a hash of the file contents
+CACHE_DIR = CACHE_ROOT / "pdf"
+
+def _content_digest(path: Path) -> str:
+    """Hash the PDF bytes so copies and touched-but-unchanged files share an entry"""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+class _ExtractionFailed(Exception):
+    """Raised out of _extract_cached so lru_cache doesn't keep the failure"""
+
+def get_or_extract(pdf_path) -> str:
+    """Return the text of a PDF, extracting it only if it is not already cached"""
+    path = Path(pdf_path).resolve()
+    try:
+        return _extract_cached(_content_digest(path), str(path))
+    except _ExtractionFailed as e:
+        # The analyzer's error text, as before; the next call tries again
+        return str(e)
+
+@functools.lru_cache(maxsize=32)
+def _extract_cached(digest: str, pdf_path: str) -> str:
+    """Look up the text for digest on disk, extracting pdf_path on a miss
+
+    Also memoized in-process, so a second call in the same run skips disk I/O.
+    """
+    path = Path(pdf_path)
+    cache_file = CACHE_DIR / f"{digest}.txt"
+    if ZSTD_AVAILABLE:
+        cache_file = cache_file.with_suffix(".txt.zst")
+
+    try:
+        data = cache_file.read_bytes()
+        if ZSTD_AVAILABLE:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data.decode("utf-8")
+    except FileNotFoundError:
+        pass
+
+    from resumemaker.tools.pdf_analyzer_tool import PDFAnalyzerTool
+    text = PDFAnalyzerTool()._run(str(path))
+
+    # The analyzer reports failures as text; keep those out of both caches,
+    # so a transient failure (a locked or half-written file) isn't repeated
+    if text.startswith("Error processing PDF"):
+        raise _ExtractionFailed(text)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        if ZSTD_AVAILABLE:
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+        cache_file.write_bytes(data)
+    except OSError as e:
+        logger.warning(f"Could not cache extracted text for {path}: {str(e)}")
+
+    return text
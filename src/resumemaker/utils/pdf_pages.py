@@ -0,0 +1,13 @@
+def extract_page_range(pdf_path, start, stop):
+    """Extract the text of pages [start, stop) with a document handle of its own
+
+    Runs in the PDF analyzer's worker processes. Those are spawned, so this
+    module imports nothing beyond PyMuPDF to keep their startup short.
+    """
+    import fitz
+
+    doc = fitz.open(pdf_path)
+    try:
+        return [doc[i].get_text("text") for i in range(start, stop)]
+    finally:
+        doc.close()
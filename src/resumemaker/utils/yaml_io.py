@@ -0,0 +1,130 @@
+import os
+import pickle
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import yaml
+
+from resumemaker.utils.paths import CACHE_ROOT
+
+logger = logging.getLogger(__name__)
+
+WATCHDOG_AVAILABLE = False
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    pass
+
+# libyaml's C loader is much faster than the pure-Python one when it is available
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs are pickled here and reused until the YAML file changes
+CACHE_DIR = CACHE_ROOT / "yaml"
+
+# Quiet period after the last change event before the watched configs reload
+RELOAD_DEBOUNCE_SECONDS = 0.5
+
+def load_yaml(path):
+    """Load a YAML file, reusing a pickled copy when the file is unchanged"""
+    path = Path(os.path.abspath(path))
+    if not path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {path}")
+
+    st = path.stat()
+    key = hashlib.blake2b(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode(), digest_size=16).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable config cache {cache_file}: {str(e)}")
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Could not cache parsed config {path}: {str(e)}")
+
+    return data
+
+def load_config_sections(paths) -> SimpleNamespace:
+    """Load each YAML file in paths (a name -> path dict) into a namespace
+
+    Sections and their top-level entries become attributes, so lookups read
+    as configs.agents.some_agent and a misspelt name fails with an
+    AttributeError naming it. The entry values stay plain dicts for CrewAI.
+    """
+    return SimpleNamespace(**{
+        key: SimpleNamespace(**load_yaml(path)) for key, path in paths.items()
+    })
+
+def watch_config_dir(directory, on_change):
+    """Call on_change whenever a YAML file in directory is modified
+
+    Edits, creations, renames and deletions count; the events of one save
+    are coalesced into a single call.
+
+    Only active when RESUMEMAKER_WATCH_CONFIG is set and watchdog is installed;
+    it lets a long-running process pick up edited prompts without a restart.
+    Returns the started observer, or None when watching is off.
+    """
+    if os.getenv("RESUMEMAKER_WATCH_CONFIG", "").lower() not in ("1", "true", "yes"):
+        return None
+    if not WATCHDOG_AVAILABLE:
+        logger.warning("RESUMEMAKER_WATCH_CONFIG is set but watchdog is not installed. Install with: pip install watchdog")
+        return None
+
+    class _Handler(FileSystemEventHandler):
+        # Only content changes count: watchdog also reports opened and closed
+        # files, and merely reading a YAML file mustn't clear the caches
+        def __init__(self):
+            super().__init__()
+            self._timer = None
+            self._lock = threading.Lock()
+
+        def on_modified(self, event):
+            self._changed(event.src_path, event)
+
+        def on_created(self, event):
+            self._changed(event.src_path, event)
+
+        def on_deleted(self, event):
+            self._changed(event.src_path, event)
+
+        def on_moved(self, event):
+            # Editors often save by writing a temp file and renaming it over the original
+            self._changed(event.src_path, event)
+            self._changed(event.dest_path, event)
+
+        def _changed(self, path, event):
+            if event.is_directory or not str(path).endswith((".yaml", ".yml")):
+                return
+            # One save fires several events; reload once they have settled
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(RELOAD_DEBOUNCE_SECONDS, self._reload, args=(path,))
+                self._timer.daemon = True
+                self._timer.start()
+
+        def _reload(self, path):
+            logger.info(f"Reloading configuration after change to {path}")
+            on_change()
+
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(_Handler(), str(directory), recursive=False)
+    observer.start()
+    return observer
@@ -0,0 +1,67 @@
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("crewai")
+
+from resumemaker.tools import pdf_analyzer_tool
+from concurrent.futures.process import BrokenProcessPool
+
+from resumemaker.tools.pdf_analyzer_tool import PDFAnalyzerTool
+
+@pytest.fixture(autouse=True)
+def shut_down_page_pool():
+    """Stop any worker processes a test started so they don't outlive it"""
+    yield
+    if pdf_analyzer_tool._page_pool is not None:
+        pdf_analyzer_tool._page_pool.shutdown()
+        pdf_analyzer_tool._page_pool = None
+
+class _BrokenPool:
+    def map(self, *args):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True):
+        pass
+
+def _write_pdf(path, page_count):
+    doc = fitz.open()
+    for i in range(page_count):
+        doc.new_page().insert_text((72, 72), f"Page {i} of the test document")
+    doc.save(str(path))
+    doc.close()
+
+def test_large_documents_are_split_across_spawned_workers(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "long.pdf"
+    page_count = 2 * pdf_analyzer_tool.PARALLEL_MIN_PAGES + 6
+    _write_pdf(pdf_path, page_count)
+    # Enough CPUs for the split even on a single-core runner
+    monkeypatch.setattr(pdf_analyzer_tool.os, "cpu_count", lambda: 4)
+
+    tool = PDFAnalyzerTool()
+    pages = tool._extract_with_fitz(str(pdf_path))
+
+    assert pdf_analyzer_tool._page_pool is not None
+    assert pages == list(tool._iter_with_fitz(str(pdf_path)))
+    assert len(pages) == page_count
+    assert "Page 69 of the test document" in pages[69]
+
+def test_broken_pool_falls_back_to_in_process_extraction(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "long.pdf"
+    page_count = 2 * pdf_analyzer_tool.PARALLEL_MIN_PAGES
+    _write_pdf(pdf_path, page_count)
+    monkeypatch.setattr(pdf_analyzer_tool.os, "cpu_count", lambda: 4)
+    pdf_analyzer_tool._page_pool = _BrokenPool()
+
+    pages = PDFAnalyzerTool()._extract_with_fitz(str(pdf_path))
+
+    assert len(pages) == page_count
+    assert pdf_analyzer_tool._page_pool is None
+
+def test_small_documents_are_extracted_in_process(tmp_path):
+    pdf_path = tmp_path / "short.pdf"
+    _write_pdf(pdf_path, 3)
+
+    text = PDFAnalyzerTool()._run(str(pdf_path))
+
+    assert "Page 0 of the test document" in text
+    assert "Page 2 of the test document" in text